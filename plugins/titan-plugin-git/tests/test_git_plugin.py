@@ -1,8 +1,12 @@
 # plugins/titan-plugin-git/tests/test_git_plugin.py
+import subprocess
+import pytest
 from unittest.mock import MagicMock
+from titan_cli.ai import cache as ai_cache
 from titan_cli.engine import WorkflowContext, is_success, is_error, is_skip, Skip
 from titan_plugin_git.steps.status_step import get_git_status_step
 from titan_plugin_git.steps.commit_step import create_git_commit_step
+from titan_plugin_git.steps.ai_commit_message_step import ai_generate_commit_message, _budget_diff
 from titan_plugin_git.clients.git_client import GitClient
 from titan_plugin_git.models import GitStatus
 from titan_plugin_git.exceptions import GitCommandError
@@ -72,7 +76,13 @@ def test_get_git_status_step_client_error():
     assert "A git error occurred" in result.message
 
 
-def test_create_git_commit_step_success():
+@pytest.fixture
+def dirty_git_status():
+    """Status of a working directory with pending changes."""
+    return GitStatus(branch="main", is_clean=False, modified_files=[], untracked_files=[], staged_files=[])
+
+
+def test_create_git_commit_step_success(dirty_git_status):
     """
     Test that create_git_commit_step successfully creates a commit.
     """
@@ -83,7 +93,7 @@ def test_create_git_commit_step_success():
     
     mock_context = MagicMock(spec=WorkflowContext)
     mock_context.git = mock_git_client
-    mock_context.data = {'git_status': GitStatus(branch="main", is_clean=False, modified_files=[], untracked_files=[], staged_files=[])} # Add mock data with all args
+    mock_context.data = {'git_status': dirty_git_status}
     mock_context.get.side_effect = lambda key, default=None: {
         'commit_message': "Test commit message",
         'all_files': True
@@ -120,14 +130,14 @@ def test_create_git_commit_step_skip_if_clean():
     # Ensure git client's commit method was not called
     mock_context.git.commit.assert_not_called()
 
-def test_create_git_commit_step_no_client():
+def test_create_git_commit_step_no_client(dirty_git_status):
     """
     Test that create_git_commit_step returns an Error if no git client is available.
     """
     # 1. Arrange
     mock_context = MagicMock(spec=WorkflowContext)
     mock_context.git = None
-    mock_context.data = {'git_status': GitStatus(branch="main", is_clean=False, modified_files=[], untracked_files=[], staged_files=[])} # Add mock data with all args
+    mock_context.data = {'git_status': dirty_git_status}
     
     # 2. Act
     result = create_git_commit_step(mock_context)
@@ -137,7 +147,7 @@ def test_create_git_commit_step_no_client():
     assert "Git client is not available" in result.message
 
 
-def test_create_git_commit_step_missing_message():
+def test_create_git_commit_step_missing_message(dirty_git_status):
     """
     Test that create_git_commit_step returns a silent Skip if commit message is missing.
     """
@@ -145,7 +155,7 @@ def test_create_git_commit_step_missing_message():
     mock_git_client = MagicMock(spec=GitClient)
     mock_context = MagicMock(spec=WorkflowContext)
     mock_context.git = mock_git_client
-    mock_context.data = {'git_status': GitStatus(branch="main", is_clean=False, modified_files=[], untracked_files=[], staged_files=[])} # Add mock data with all args
+    mock_context.data = {'git_status': dirty_git_status}
     mock_context.get.return_value = None # Simulate no commit message
 
     # 2. Act
@@ -157,7 +167,7 @@ def test_create_git_commit_step_missing_message():
     mock_git_client.commit.assert_not_called()
 
 
-def test_create_git_commit_step_client_error():
+def test_create_git_commit_step_client_error(dirty_git_status):
     """
     Test that create_git_commit_step returns an Error if the client's commit operation fails.
     """
@@ -167,7 +177,7 @@ def test_create_git_commit_step_client_error():
     
     mock_context = MagicMock(spec=WorkflowContext)
     mock_context.git = mock_git_client
-    mock_context.data = {'git_status': GitStatus(branch="main", is_clean=False, modified_files=[], untracked_files=[], staged_files=[])} # Add mock data with all args
+    mock_context.data = {'git_status': dirty_git_status}
     mock_context.get.side_effect = lambda key, default=None: {
         'commit_message': "Test commit message",
         'all_files': False
@@ -180,3 +190,204 @@ def test_create_git_commit_step_client_error():
     assert is_error(result)
     assert "Git command failed during commit" in result.message
     assert "Commit command failed" in result.message
+
+
+def test_ai_generate_commit_message_cache(monkeypatch, tmp_path, dirty_git_status):
+    """
+    Test that an accepted message is cached and reused for the same diff, and
+    that rejecting it evicts the entry.
+    """
+    # 1. Arrange
+    monkeypatch.setattr(ai_cache, "DEFAULT_CACHE_DIR", tmp_path)
+    mock_ai = MagicMock()
+    mock_ai.generate.return_value = MagicMock(content="feat(core): add thing")
+    mock_git_client = MagicMock(spec=GitClient)
+    mock_git_client.get_uncommitted_diff.return_value = "diff --git a/a.py b/a.py\n+x = 1\n"
+    mock_views = MagicMock()
+    ctx = WorkflowContext(
+        secrets=MagicMock(), ui=MagicMock(), views=mock_views, ai=mock_ai, git=mock_git_client,
+        data={'git_status': dirty_git_status},
+    )
+
+    # 2. Act / 3. Assert
+    # Accepted message is stored
+    mock_views.prompts.ask_confirm.return_value = True
+    assert ai_generate_commit_message(ctx).metadata['commit_message'] == "feat(core): add thing"
+    assert mock_ai.generate.call_count == 1
+    assert list((tmp_path / "commit_messages").iterdir())
+
+    # Same diff is served from the cache
+    assert ai_generate_commit_message(ctx).metadata['commit_message'] == "feat(core): add thing"
+    assert mock_ai.generate.call_count == 1
+
+    # Rejecting the cached message evicts it
+    mock_views.prompts.ask_confirm.return_value = False
+    assert is_skip(ai_generate_commit_message(ctx))
+    assert mock_ai.generate.call_count == 1
+    assert not list((tmp_path / "commit_messages").iterdir())
+
+
+def _init_repo(path):
+    """Initialize a git repository at `path` and return a git command runner for it."""
+    for args in (["init", "-q", "-b", "main"], ["config", "user.email", "test@example.com"], ["config", "user.name", "Test"]):
+        subprocess.run(["git", *args], cwd=path, check=True)
+    return lambda *args: subprocess.run(["git", *args], cwd=path, check=True, capture_output=True)
+
+
+def test_get_status_parses_porcelain_v2(tmp_path):
+    """
+    Test that get_status reports branch and file states from a single status call.
+    """
+    # 1. Arrange
+    git = _init_repo(tmp_path)
+    for name in ("tracked.txt", "staged.txt", "old name.txt"):
+        (tmp_path / name).write_text("content\n")
+    git("add", ".")
+    git("commit", "-q", "-m", "initial")
+    git("checkout", "-q", "-b", "feature/x")
+
+    (tmp_path / "tracked.txt").write_text("changed\n")
+    (tmp_path / "staged.txt").write_text("changed\n")
+    git("add", "staged.txt")
+    git("mv", "old name.txt", "new name.txt")
+    (tmp_path / "untracked.txt").write_text("new\n")
+
+    client = GitClient(repo_path=str(tmp_path))
+
+    # 2. Act
+    status = client.get_status()
+
+    # 3. Assert
+    assert status.branch == "feature/x"
+    assert not status.is_clean
+    assert status.modified_files == ["tracked.txt"]
+    assert sorted(status.staged_files) == ["new name.txt", "staged.txt"]
+    assert status.untracked_files == ["untracked.txt"]
+    assert (status.ahead, status.behind) == (0, 0)
+
+
+def test_budget_diff_shares_budget_across_files():
+    """A large file diff doesn't crowd out the others."""
+    small = "diff --git a/small.py b/small.py\n+x = 1\n"
+    large = "diff --git a/large.py b/large.py\n" + "+y = 2\n" * 1000
+    other = "diff --git a/other.py b/other.py\n+z = 3\n"
+
+    result = _budget_diff(large + small + other, max_chars=500)
+
+    assert small in result
+    assert other in result
+    assert result.startswith("diff --git a/large.py b/large.py")
+    assert "truncated" in result
+    assert len(result) < 600
+    assert _budget_diff(small, max_chars=500) == small
+
+
+@pytest.mark.parametrize("file_count", [3, 30, 60])
+def test_budget_diff_keeps_hunks_within_budget(file_count):
+    """Many large file diffs still get hunk lines and never exceed the budget."""
+    diff_text = "".join(
+        f"diff --git a/file{i}.py b/file{i}.py\n"
+        "index 1234567..89abcde 100644\n"
+        f"--- a/file{i}.py\n"
+        f"+++ b/file{i}.py\n"
+        "@@ -0,0 +1,200 @@\n"
+        + f"+added line in file{i}\n" * 200
+        for i in range(file_count)
+    )
+
+    result = _budget_diff(diff_text, max_chars=4000)
+
+    assert len(result) <= 4000
+    kept = [i for i in range(file_count) if f"+added line in file{i}\n" in result]
+    assert len(kept) == min(file_count, 10)
+
+
+def test_get_branch_commits_and_diff(tmp_path):
+    """
+    Test that commits and diff of a branch are returned together.
+    """
+    # 1. Arrange
+    git = _init_repo(tmp_path)
+    (tmp_path / "base.txt").write_text("base\n")
+    git("add", ".")
+    git("commit", "-q", "-m", "initial")
+    git("checkout", "-q", "-b", "feature")
+    for i in range(2):
+        (tmp_path / f"feature{i}.txt").write_text("feature\n")
+        git("add", ".")
+        git("commit", "-q", "-m", f"feat: change {i}")
+    client = GitClient(repo_path=str(tmp_path))
+
+    # 2. Act
+    commits, diff = client.get_branch_commits_and_diff("main", "feature")
+
+    # 3. Assert
+    assert commits == client.get_branch_commits("main", "feature") == ["feat: change 1", "feat: change 0"]
+    assert diff == client.get_branch_diff("main", "feature")
+    assert "b/feature0.txt" in diff and "b/feature1.txt" in diff
+    assert client.get_branch_commits_and_diff("main", "missing") == ([], "")
+
+
+def test_get_branch_commits_and_diff_drops_failed_diff(monkeypatch, tmp_path):
+    """
+    Test that output of a failing git diff (e.g. no merge base) is not returned as a diff.
+    """
+    # 1. Arrange
+    log_proc = MagicMock(returncode=0)
+    log_proc.communicate.return_value = ("feat: change", None)
+    diff_proc = MagicMock(returncode=128)
+    diff_proc.communicate.return_value = ("diff --git a/partial.txt b/partial.txt", None)
+    client = GitClient(repo_path=str(tmp_path))
+    monkeypatch.setattr(subprocess, "Popen", MagicMock(side_effect=[log_proc, diff_proc]))
+
+    # 2. Act
+    commits, diff = client.get_branch_commits_and_diff("main", "feature")
+
+    # 3. Assert
+    assert commits == ["feat: change"]
+    assert diff == ""
+
+
+def test_get_branch_commits_and_diff_reaps_log_process(monkeypatch, tmp_path):
+    """
+    Test that the git log process is killed and reaped if git diff can't start.
+    """
+    # 1. Arrange
+    log_proc = MagicMock()
+    popen = MagicMock(side_effect=[log_proc, OSError("fork failed")])
+    client = GitClient(repo_path=str(tmp_path))
+    monkeypatch.setattr(subprocess, "Popen", popen)
+
+    # 2. Act
+    result = client.get_branch_commits_and_diff("main", "feature")
+
+    # 3. Assert
+    assert result == ([], "")
+    log_proc.kill.assert_called_once()
+    log_proc.communicate.assert_called_once()
+
+
+def test_get_github_repo_info_reads_origin_from_config(monkeypatch, tmp_path):
+    """
+    Test that owner and repo are read from the git config without running git.
+    """
+    # 1. Arrange
+    url = "git@github.com:masmovil/titan-cli.git"
+    git = _init_repo(tmp_path)
+    git("remote", "add", "origin", url)
+    git("commit", "-q", "--allow-empty", "-m", "initial")
+    git("worktree", "add", "-q", str(tmp_path / "wt"))
+    (tmp_path / "sub").mkdir()
+    client = GitClient(repo_path=str(tmp_path / "sub"))
+    worktree_client = GitClient(repo_path=str(tmp_path / "wt"))
+    run_command = MagicMock(side_effect=AssertionError("git should not be run"))
+    monkeypatch.setattr(GitClient, "_run_command", run_command)
+
+    # 2. Act
+    owner, repo = client.get_github_repo_info()
+
+    # 3. Assert
+    assert (owner, repo) == ("masmovil", "titan-cli")
+    assert client._read_origin_url_from_config() == url
+    assert worktree_client._read_origin_url_from_config() == url
+    run_command.assert_not_called()
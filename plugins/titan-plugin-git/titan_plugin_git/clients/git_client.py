@@ -1,4 +1,6 @@
 # plugins/titan-plugin-git/titan_plugin_git/clients/git_client.py
+import configparser
+import os
 import subprocess
 import re
 import shutil # Added for shutil.which
@@ -17,6 +19,9 @@ from ..exceptions import (
 )
 from ..messages import msg
 
+# owner/repo from git@github.com:owner/repo.git or https://github.com/owner/repo.git
+_GITHUB_URL_RE = re.compile(r'github\.com[:/]([^/]+)/([^/.]+)')
+
 
 class GitClient:
     """
@@ -112,40 +117,70 @@ class GitClient:
         """
         return self._run_command(["git", "rev-parse", "--abbrev-ref", "HEAD"])
 
+    def rev_parse(self, *refs: str) -> List[str]:
+        """
+        Resolve refs to commit SHAs with a single git call
+
+        Args:
+            *refs: Branch names, tags or other revisions
+
+        Returns:
+            SHAs in the same order as refs
+
+        Raises:
+            GitCommandError: If any ref can't be resolved
+        """
+        return self._run_command(["git", "rev-parse", *refs]).splitlines()
+
     def get_status(self) -> GitStatus:
         """
         Get repository status
 
+        Branch name, ahead/behind counts and file states all come from a
+        single `git status --porcelain=v2 --branch -z` call.
+
         Returns:
             GitStatus object
         """
-        branch = self.get_current_branch()
-
-        status_output = self._run_command(["git", "status", "--short"])
+        status_output = self._run_command(
+            ["git", "status", "--porcelain=v2", "--branch", "-z"]
+        )
 
+        branch = "HEAD"
+        ahead, behind = 0, 0
         modified = []
         untracked = []
         staged = []
 
-        for line in status_output.splitlines():
-            if not line.strip():
+        records = iter(status_output.split("\0"))
+        for record in records:
+            if not record:
                 continue
 
-            status_code = line[:2]
-            file_path = line[3:].strip()
-
-            if status_code[0] != ' ' and status_code[0] != '?':
-                staged.append(file_path)
-
-            if status_code[1] == 'M':
-                modified.append(file_path)
-            elif status_code == '??':
-                untracked.append(file_path)
+            if record.startswith("# branch.head "):
+                head = record[len("# branch.head "):]
+                branch = "HEAD" if head == "(detached)" else head
+            elif record.startswith("# branch.ab "):
+                # Format: "# branch.ab +<ahead> -<behind>"
+                ahead_str, behind_str = record[len("# branch.ab "):].split()
+                ahead, behind = int(ahead_str), abs(int(behind_str))
+            elif record.startswith("? "):
+                untracked.append(record[2:])
+            elif record[:2] in ("1 ", "2 ", "u "):
+                entry_type = record[0]
+                # Ordinary entries have 8 fields before the path, renames 9, unmerged 10
+                fields = record.split(" ", {"1": 8, "2": 9, "u": 10}[entry_type])
+                status_code, file_path = fields[1], fields[-1]
+                if entry_type == "2":
+                    next(records, None)  # Skip the rename's original path
+
+                if status_code[0] != '.':
+                    staged.append(file_path)
+                if status_code[1] == 'M':
+                    modified.append(file_path)
 
         is_clean = not (modified or untracked or staged)
 
-        ahead, behind = self._get_upstream_status()
-
         return GitStatus(
             branch=branch,
             is_clean=is_clean,
@@ -156,23 +191,6 @@ class GitClient:
             behind=behind
         )
 
-    def _get_upstream_status(self) -> Tuple[int, int]:
-        """Get commits ahead/behind upstream"""
-        try:
-            output = self._run_command(
-                ["git", "rev-list", "--left-right", "--count", "HEAD...@{u}"],
-                check=False
-            )
-            if output:
-                # Output might be empty if no upstream or no diff
-                parts = output.split()
-                if len(parts) == 2:
-                    return int(parts[0]), int(parts[1])
-        except GitCommandError:
-            # No upstream configured
-            pass
-        return 0, 0
-
     def checkout(self, branch: str) -> None:
         """
         Checkout a branch
@@ -760,6 +778,103 @@ class GitClient:
         except GitCommandError:
             return []
 
+    def get_branch_commits_and_diff(
+        self,
+        base_branch: str,
+        head_branch: str
+    ) -> Tuple[list[str], str]:
+        """
+        Get the commits and the diff of head_branch against base_branch.
+
+        Equivalent to calling get_branch_commits() and get_branch_diff(), but
+        both git processes run concurrently instead of one after the other.
+
+        The processes are started with Popen directly because _run_command
+        waits for each command to finish. That also skips its error mapping,
+        which is fine here: like the two methods above, failures just yield
+        empty results instead of a GitError.
+
+        Args:
+            base_branch: Base branch name
+            head_branch: Head branch name
+
+        Returns:
+            Tuple of (commit messages, diff output)
+        """
+        try:
+            log_proc = subprocess.Popen(
+                ["git", "log", f"{base_branch}..{head_branch}", "--pretty=format:%s"],
+                cwd=self.repo_path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
+            )
+        except OSError:
+            return [], ""
+
+        try:
+            diff_proc = subprocess.Popen(
+                ["git", "diff", f"{base_branch}...{head_branch}"],
+                cwd=self.repo_path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
+            )
+        except OSError:
+            # Don't leave the log process running
+            log_proc.kill()
+            log_proc.communicate()
+            return [], ""
+
+        # Drain the (larger) diff first; the log pipe is read right after
+        diff_output, _ = diff_proc.communicate()
+        log_output, _ = log_proc.communicate()
+
+        commits = log_output.strip().split("\n") if log_proc.returncode == 0 and log_output.strip() else []
+        diff = diff_output.strip() if diff_proc.returncode == 0 else ""
+        return commits, diff
+
+    def _read_origin_url_from_config(self) -> Optional[str]:
+        """
+        Read the 'origin' remote URL straight from the repository's git config.
+
+        Avoids spawning `git remote get-url`. Handles `.git` files pointing to
+        a separate git dir (worktrees, submodules).
+
+        Returns:
+            Remote URL, or None if it can't be determined this way
+        """
+        path = os.path.abspath(self.repo_path)
+        while True:
+            dot_git = os.path.join(path, ".git")
+            if os.path.exists(dot_git):
+                break
+            parent = os.path.dirname(path)
+            if parent == path:
+                return None
+            path = parent
+
+        try:
+            git_dir = dot_git
+            if os.path.isfile(dot_git):
+                with open(dot_git, "r") as f:
+                    content = f.read().strip()
+                if not content.startswith("gitdir:"):
+                    return None
+                git_dir = os.path.join(path, content[len("gitdir:"):].strip())
+
+            # Linked worktrees keep the shared config in the common dir
+            commondir_file = os.path.join(git_dir, "commondir")
+            if os.path.isfile(commondir_file):
+                with open(commondir_file, "r") as f:
+                    git_dir = os.path.join(git_dir, f.read().strip())
+
+            config = configparser.ConfigParser(strict=False, interpolation=None)
+            config.read(os.path.join(git_dir, "config"))
+            return config.get('remote "origin"', "url", fallback=None)
+        except (OSError, configparser.Error):
+            return None
+
     def get_github_repo_info(self) -> Tuple[Optional[str], Optional[str]]:
         """
         Extracts GitHub repository owner and name from the 'origin' remote URL.
@@ -767,14 +882,19 @@ class GitClient:
         Returns:
             A tuple containing (repo_owner, repo_name) if detected, otherwise (None, None).
         """
+        # Parse: git@github.com:owner/repo.git or https://github.com/owner/repo.git
+        url = self._read_origin_url_from_config()
+        match = _GITHUB_URL_RE.search(url) if url else None
+        if match:
+            return match.group(1), match.group(2)
+
+        # Fall back to git itself (handles includes, url.insteadOf rewrites, ...)
         try:
             url = self._run_command(["git", "remote", "get-url", "origin"])
-
-            # Parse: git@github.com:owner/repo.git or https://github.com/owner/repo.git
-            match = re.search(r'github\.com[:/]([^/]+)/([^/.]+)', url)
+            match = _GITHUB_URL_RE.search(url)
             if match:
                 return match.group(1), match.group(2)
         except GitCommandError:
             # Command failed, likely no remote 'origin' or not a git repo
             pass
-        return None, None
\ No newline at end of file
+        return None, None
@@ -94,6 +94,7 @@ class Messages:
             NO_UNCOMMITTED_CHANGES: str = "No uncommitted changes to analyze"
             DIFF_TRUNCATED: str = "... (diff truncated for brevity)"
             GENERATING_MESSAGE: str = "Generating commit message with AI..."
+            USING_CACHED_MESSAGE: str = "Using cached AI commit message for identical changes"
             GENERATED_MESSAGE_TITLE: str = "AI Generated Commit Message:"
             MESSAGE_LENGTH_WARNING: str = "Message is {length} chars (recommended: ≤72)"
             CONFIRM_USE_MESSAGE: str = "Use this commit message?"
@@ -1,16 +1,15 @@
 # plugins/titan-plugin-git/titan_plugin_git/plugin.py
 import shutil
+from typing import TYPE_CHECKING
 from titan_cli.core.plugins.models import GitPluginConfig
 from titan_cli.core.plugins.plugin_base import TitanPlugin
-from titan_cli.core.config import TitanConfig # Needed for type hinting
-from titan_cli.core.secrets import SecretManager # Needed for type hinting
 from .clients.git_client import GitClient
 from .exceptions import GitClientError
 from .messages import msg
-from .steps.status_step import get_git_status_step
-from .steps.commit_step import create_git_commit_step
-from .steps.prompt_step import prompt_for_commit_message_step
-from .steps.push_step import create_git_push_step
+
+if TYPE_CHECKING:
+    from titan_cli.core.config import TitanConfig
+    from titan_cli.core.secrets import SecretManager
 
 
 class GitPlugin(TitanPlugin):
@@ -31,7 +30,7 @@ class GitPlugin(TitanPlugin):
     def dependencies(self) -> list[str]:
         return []
 
-    def initialize(self, config: TitanConfig, secrets: SecretManager) -> None:
+    def initialize(self, config: "TitanConfig", secrets: "SecretManager") -> None:
         """
         Initialize with configuration.
         
@@ -52,7 +51,7 @@ class GitPlugin(TitanPlugin):
             protected_branches=validated_config.protected_branches
         )
 
-    def _get_plugin_config(self, config: TitanConfig) -> dict:
+    def _get_plugin_config(self, config: "TitanConfig") -> dict:
         """
         Extract plugin-specific configuration.
         
@@ -98,6 +97,10 @@ class GitPlugin(TitanPlugin):
         """
         Returns a dictionary of available workflow steps.
         """
+        from .steps.status_step import get_git_status_step
+        from .steps.commit_step import create_git_commit_step
+        from .steps.prompt_step import prompt_for_commit_message_step
+        from .steps.push_step import create_git_push_step
         from .steps.branch_steps import get_current_branch_step, get_base_branch_step
         from .steps.ai_commit_message_step import ai_generate_commit_message
 
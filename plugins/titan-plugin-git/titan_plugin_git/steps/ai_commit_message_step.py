@@ -1,7 +1,72 @@
 # plugins/titan-plugin-git/titan_plugin_git/steps/ai_commit_message_step.py
+import re
+
+from titan_cli.ai.cache import ResponseCache, make_cache_key
 from titan_cli.engine import WorkflowContext, WorkflowResult, Success, Error, Skip
 from titan_plugin_git.messages import msg
 
+# Maximum diff characters sent to the AI
+_MAX_DIFF_CHARS = 4000
+
+# Maximum number of files that share the diff budget once it runs short
+_MAX_DIFF_FILES = 10
+
+_FILE_HEADER_RE = re.compile(r"^diff --git ", re.MULTILINE)
+
+
+def _budget_diff(diff_text: str, max_chars: int = _MAX_DIFF_CHARS) -> str:
+    """
+    Truncate a multi-file diff so every file gets a share of the budget.
+
+    A plain prefix slice spends the whole budget on the first large file and
+    drops the rest. Instead, small file diffs are kept whole and what they
+    leave is split evenly among at most _MAX_DIFF_FILES of the larger ones.
+    Files beyond that are left out; they are still listed in the prompt's
+    file summary.
+
+    Args:
+        diff_text: Output of `git diff`
+        max_chars: Total character budget
+
+    Returns:
+        Diff of at most max_chars characters, with truncated files marked
+    """
+    if len(diff_text) <= max_chars:
+        return diff_text
+
+    starts = [m.start() for m in _FILE_HEADER_RE.finditer(diff_text)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    ends = starts[1:] + [len(diff_text)]
+    chunks = [diff_text[start:end] for start, end in zip(starts, ends)]
+
+    # Hand out the budget smallest-first so leftovers flow to larger files
+    budgets = [0] * len(chunks)
+    remaining = max_chars
+    order = sorted(range(len(chunks)), key=lambda i: len(chunks[i]))
+    for position, index in enumerate(order):
+        share = remaining // min(len(chunks) - position, _MAX_DIFF_FILES)
+        if len(chunks[index]) > share:
+            # This file and all larger ones need truncating: split what is
+            # left evenly among the next few and leave the others out
+            for index in order[position:position + _MAX_DIFF_FILES]:
+                budgets[index] = share
+            break
+        budgets[index] = len(chunks[index])
+        remaining -= budgets[index]
+
+    marker = f"\n{msg.Steps.AICommitMessage.DIFF_TRUNCATED}\n"
+    parts = []
+    for chunk, budget in zip(chunks, budgets):
+        if len(chunk) <= budget:
+            parts.append(chunk)
+            continue
+        # Skip files whose share would not reach past their headers
+        cut = budget - len(marker)
+        if cut > max(chunk.find("\n@@"), 0):
+            parts.append(f"{chunk[:cut].rstrip()}{marker}")
+    return "".join(parts)
+
 
 def ai_generate_commit_message(ctx: WorkflowContext) -> WorkflowResult:
     """
@@ -16,6 +81,8 @@ def ai_generate_commit_message(ctx: WorkflowContext) -> WorkflowResult:
 
     Inputs (from ctx.data):
         git_status: Current git status with changes.
+        use_ai_cache (bool, optional): Reuse the message accepted for an identical
+            diff in the last hour instead of calling the AI. Defaults to True.
 
     Outputs (saved to ctx.data):
         commit_message (str): AI-generated commit message.
@@ -68,12 +135,10 @@ def ai_generate_commit_message(ctx: WorkflowContext) -> WorkflowResult:
         # Build AI prompt
         # Get list of modified files for the summary
         all_files = git_status.modified_files + git_status.untracked_files + git_status.staged_files
-        files_summary = "\n".join([f"  - {f}" for f in all_files]) if all_files else "(checking diff)"
+        files_summary = "\n".join(f"  - {f}" for f in all_files) if all_files else "(checking diff)"
 
-        # Limit diff size to avoid token overflow (keep first 4000 chars)
-        diff_preview = diff_text[:4000] if len(diff_text) > 4000 else diff_text
-        if len(diff_text) > 4000:
-            diff_preview += f"\n\n{msg.Steps.AICommitMessage.DIFF_TRUNCATED}"
+        # Limit diff size to avoid token overflow, sharing the budget across files
+        diff_preview = _budget_diff(diff_text)
 
         prompt = f"""Analyze these code changes and generate a conventional commit message.
 
@@ -100,21 +165,30 @@ Examples (notice they are all one line):
 
 Return ONLY the single-line commit message, absolutely nothing else."""
 
-        if ctx.ui:
-            ctx.ui.text.info(msg.Steps.AICommitMessage.GENERATING_MESSAGE)
+        # Reuse a previously accepted message for an identical prompt
+        cache = ResponseCache("commit_messages") if ctx.get('use_ai_cache', True) else None
+        cache_key = make_cache_key(prompt)
+        commit_message = cache.get(cache_key) if cache else None
+
+        if commit_message:
+            if ctx.ui:
+                ctx.ui.text.info(msg.Steps.AICommitMessage.USING_CACHED_MESSAGE)
+        else:
+            if ctx.ui:
+                ctx.ui.text.info(msg.Steps.AICommitMessage.GENERATING_MESSAGE)
 
-        # Call AI
-        from titan_cli.ai.models import AIMessage
+            # Call AI
+            from titan_cli.ai.models import AIMessage
 
-        messages = [AIMessage(role="user", content=prompt)]
-        response = ctx.ai.generate(messages, max_tokens=300, temperature=0.7)
+            messages = [AIMessage(role="user", content=prompt)]
+            response = ctx.ai.generate(messages, max_tokens=300, temperature=0.7)
 
-        commit_message = response.content.strip()
+            commit_message = response.content.strip()
 
-        # Clean up the message (remove quotes, newlines, extra whitespace)
-        commit_message = commit_message.strip('"').strip("'").strip()
-        # Take only the first line if AI returned multiple lines
-        commit_message = commit_message.split('\n')[0].strip()
+            # Clean up the message (remove quotes, newlines, extra whitespace)
+            commit_message = commit_message.strip('"').strip("'").strip()
+            # Take only the first line if AI returned multiple lines
+            commit_message = commit_message.split('\n')[0].strip()
 
         # Show preview to user
         if ctx.ui:
@@ -135,8 +209,14 @@ Return ONLY the single-line commit message, absolutely nothing else."""
             )
 
             if not use_ai:
+                # Don't offer the same rejected message again on the next run
+                if cache:
+                    cache.delete(cache_key)
                 return Skip(msg.Steps.AICommitMessage.USER_DECLINED)
 
+        if cache:
+            cache.set(cache_key, commit_message)
+
         # Show success panel
         if ctx.ui:
             ctx.ui.panel.print(
@@ -44,17 +44,15 @@ def create_git_push_step(ctx: WorkflowContext) -> WorkflowResult:
             set_upstream = True
 
         ctx.git.push(remote=remote_to_use, branch=branch_to_use, set_upstream=set_upstream)
+        success_msg = msg.Git.PUSH_SUCCESS.format(remote=remote_to_use, branch=branch_to_use)
 
         # Show success panel
         if ctx.ui:
-            ctx.ui.panel.print(
-                f"Pushed to {remote_to_use}/{branch_to_use}",
-                panel_type="success"
-            )
+            ctx.ui.panel.print(success_msg, panel_type="success")
             ctx.ui.spacer.small()
 
         return Success(
-            message=msg.Git.PUSH_SUCCESS.format(remote=remote_to_use, branch=branch_to_use),
+            message=success_msg,
             metadata={"pr_head_branch": branch_to_use}
         )
     except GitCommandError as e:
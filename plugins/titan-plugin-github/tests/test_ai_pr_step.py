@@ -0,0 +1,142 @@
+# plugins/titan-plugin-github/tests/test_ai_pr_step.py
+import pytest
+import yaml
+from pathlib import Path
+from unittest.mock import MagicMock
+from titan_cli.ai import cache as ai_cache
+from titan_cli.ai.cache import ResponseCache, make_cache_key
+from titan_cli.core.workflows.workflow_registry import ParsedWorkflow
+from titan_cli.engine import WorkflowContext, Success, Skip
+from titan_cli.engine.workflow_executor import WorkflowExecutor
+from titan_plugin_github.agents.pr_agent import PRAnalysis
+from titan_plugin_github.steps import ai_pr_step
+from titan_plugin_github.steps.ai_pr_step import ai_suggest_pr_description
+
+CREATE_PR_WORKFLOW = Path(ai_pr_step.__file__).parent.parent / "workflows" / "create-pr.yaml"
+
+
+@pytest.mark.parametrize(
+    "use_ai, ai_configured, expected_cls, expected_substr",
+    [
+        (False, True, Skip, "use_ai=false"),
+        (None, False, Skip, "AI not configured"),
+        (True, False, Skip, "AI not configured"),
+        (None, True, Success, "AI generated PR description"),
+        (True, True, Success, "AI generated PR description"),
+    ],
+)
+def test_ai_suggest_pr_description_opt_in(monkeypatch, use_ai, ai_configured, expected_cls, expected_substr):
+    """
+    Test that the step only calls the AI when use_ai allows it and AI is configured.
+    """
+    # 1. Arrange
+    mock_agent = MagicMock()
+    mock_agent.analyze_and_plan.return_value = PRAnalysis(
+        needs_commit=False,
+        pr_title="feat(api): add endpoint",
+        pr_body="Adds the new endpoint.",
+        pr_size="small",
+    )
+    monkeypatch.setattr(ai_pr_step, "PRAgent", MagicMock(return_value=mock_agent))
+
+    data = {"pr_head_branch": "feature", "use_ai_cache": False}
+    if use_ai is not None:
+        data["use_ai"] = use_ai
+    mock_ai = MagicMock()
+    mock_ai.is_available.return_value = ai_configured
+    ctx = WorkflowContext(secrets=MagicMock(), ai=mock_ai, git=MagicMock(main_branch="main"), data=data)
+
+    # 2. Act
+    result = ai_suggest_pr_description(ctx)
+
+    # 3. Assert
+    assert isinstance(result, expected_cls)
+    assert expected_substr in result.message
+    assert mock_agent.analyze_and_plan.called == (expected_cls is Success)
+    if use_ai is False:
+        mock_ai.is_available.assert_not_called()
+
+
+@pytest.mark.parametrize("accepted, expected_cls", [(True, Success), (False, Skip)])
+def test_ai_suggest_pr_description_cache(monkeypatch, tmp_path, accepted, expected_cls):
+    """
+    Test that a cached PR for the same commits is reused without calling the
+    agent, and that rejecting it evicts the entry.
+    """
+    # 1. Arrange
+    monkeypatch.setattr(ai_cache, "DEFAULT_CACHE_DIR", tmp_path)
+    mock_agent = MagicMock()
+    mock_agent.read_pr_template.return_value = None
+    monkeypatch.setattr(ai_pr_step, "PRAgent", MagicMock(return_value=mock_agent))
+
+    cache = ResponseCache("pr_descriptions")
+    cache_key = make_cache_key("base-sha", "head-sha", "")
+    cache.set(cache_key, {
+        "pr_title": "feat(api): add endpoint",
+        "pr_body": "Adds the new endpoint.",
+        "pr_size": "small",
+        "files_changed": 1,
+        "lines_changed": 10,
+    })
+
+    mock_ai = MagicMock()
+    mock_ai.is_available.return_value = True
+    mock_git = MagicMock(main_branch="main")
+    mock_git.rev_parse.return_value = ["base-sha", "head-sha"]
+    mock_views = MagicMock()
+    mock_views.prompts.ask_confirm.return_value = accepted
+    ctx = WorkflowContext(
+        secrets=MagicMock(), ui=MagicMock(), views=mock_views, ai=mock_ai, git=mock_git,
+        data={"pr_head_branch": "feature"},
+    )
+
+    # 2. Act
+    result = ai_suggest_pr_description(ctx)
+
+    # 3. Assert
+    assert isinstance(result, expected_cls)
+    mock_agent.analyze_and_plan.assert_not_called()
+    mock_git.rev_parse.assert_called_once_with("main", "feature")
+    if accepted:
+        assert result.metadata["pr_title"] == "feat(api): add endpoint"
+        assert cache.get(cache_key) is not None
+    else:
+        assert cache.get(cache_key) is None
+
+
+def test_create_pr_workflow_use_ai_false_skips_ai():
+    """
+    Test that the create-pr workflow's use_ai: false param, merged into
+    ctx.data by the executor, makes the step skip without touching the AI.
+    """
+    # 1. Arrange
+    definition = yaml.safe_load(CREATE_PR_WORKFLOW.read_text())
+    assert definition["params"]["use_ai"] is False
+    workflow = ParsedWorkflow(
+        name=definition["name"],
+        description=definition["description"],
+        source="test",
+        steps=[step for step in definition["steps"] if step.get("id") == "ai_suggest_pr"],
+        params=definition["params"],
+    )
+
+    results = []
+
+    def step(ctx):
+        results.append(ai_suggest_pr_description(ctx))
+        return results[-1]
+
+    mock_github_plugin = MagicMock()
+    mock_github_plugin.get_steps.return_value = {"ai_suggest_pr_description": step}
+    mock_plugin_registry = MagicMock()
+    mock_plugin_registry.get_plugin.return_value = mock_github_plugin
+    mock_ai = MagicMock()
+    ctx = WorkflowContext(secrets=MagicMock(), ui=MagicMock(), views=MagicMock(), ai=mock_ai)
+
+    # 2. Act
+    result = WorkflowExecutor(mock_plugin_registry, MagicMock()).execute(workflow, ctx)
+
+    # 3. Assert
+    assert isinstance(result, Success)
+    assert len(results) == 1 and isinstance(results[0], Skip)
+    assert mock_ai.mock_calls == []
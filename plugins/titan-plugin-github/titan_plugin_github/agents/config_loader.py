@@ -1,17 +1,24 @@
 # plugins/titan-plugin-github/titan_plugin_github/agents/config_loader.py
 """Configuration loader for PR Agent."""
 
-import tomli
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+try:
+    # Python 3.11+
+    import tomllib
+except ImportError:
+    # Python 3.10 fallback
+    import tomli as tomllib
 
 try:
     # Python 3.9+
-    from importlib.resources import files
+    from importlib.resources import as_file, files
 except ImportError:
     # Python 3.7-3.8 fallback
-    from importlib_resources import files
+    from importlib_resources import as_file, files
 
 # Import default limits from plugin utils
 from ..utils import (
@@ -22,7 +29,13 @@ from ..utils import (
 
 
 class PRAgentConfig(BaseModel):
-    """PR Agent configuration loaded from TOML."""
+    """PR Agent configuration loaded from TOML.
+
+    Instances are frozen: load_agent_config() shares one cached instance
+    between all agents, so it must not be mutated after loading.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     name: str = Field(..., description="Agent name")
     description: str = Field("", description="Agent description")
@@ -44,11 +57,32 @@ class PRAgentConfig(BaseModel):
     enable_user_confirmation: bool = Field(True, description="Enable user confirmation")
     enable_fallback_prompts: bool = Field(True, description="Enable fallback prompts")
     enable_debug_output: bool = Field(False, description="Enable debug output")
+    enable_prompt_caching: bool = Field(True, description="Enable provider-side prompt caching")
 
     # Raw config for custom access
     raw: Dict[str, Any] = Field(default_factory=dict, description="Raw TOML data")
 
 
+def _read_toml(config_path: Path) -> Dict[str, Any]:
+    """
+    Read and parse a TOML config file.
+
+    Raises:
+        FileNotFoundError: If config file doesn't exist
+        ValueError: If config can't be read or parsed
+    """
+    try:
+        with open(config_path, "rb") as f:
+            return tomllib.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Agent config not found: {config_path}")
+    except tomllib.TOMLDecodeError as e:
+        raise ValueError(f"Invalid TOML in {config_path}: {e}")
+    except Exception as e:
+        raise ValueError(f"Failed to read config {config_path}: {e}")
+
+
+@lru_cache(maxsize=8)
 def load_agent_config(
     agent_name: str = "pr_agent",
     config_dir: Optional[Path] = None
@@ -56,6 +90,10 @@ def load_agent_config(
     """
     Load agent configuration from TOML file.
 
+    Results are cached per (agent_name, config_dir) so the TOML file is only
+    read and parsed once per process. Call `load_agent_config.cache_clear()`
+    to force a reload.
+
     Args:
         agent_name: Name of the agent (e.g., "pr_agent")
         config_dir: Optional custom config directory
@@ -67,44 +105,27 @@ def load_agent_config(
         FileNotFoundError: If config file doesn't exist
         ValueError: If config is invalid
     """
-    # Determine config file path
+    # Determine config file path and load TOML
     if config_dir:
         config_path = config_dir / f"{agent_name}.toml"
+        data = _read_toml(config_path)
     else:
         # Use importlib.resources for robust path resolution
-        # Works with both development and installed (pip/pipx) environments
-        config_files = files("titan_plugin_github.config")
-        config_file = config_files.joinpath(f"{agent_name}.toml")
-
-        # Convert Traversable to Path
-        # In Python 3.9+, this handles both filesystem and zip-based resources
-        if hasattr(config_file, "__fspath__"):
-            config_path = Path(config_file.__fspath__())
-        else:
-            # Fallback for older Python or non-filesystem resources
-            config_path = Path(str(config_file))
-
-    if not config_path.exists():
-        raise FileNotFoundError(f"Agent config not found: {config_path}")
-
-    # Load TOML
-    try:
-        with open(config_path, "rb") as f:
-            data = tomli.load(f)
-    except tomli.TOMLDecodeError as e:
-        raise ValueError(f"Invalid TOML in {config_path}: {e}")
-    except Exception as e:
-        raise ValueError(f"Failed to read config {config_path}: {e}")
+        # Works with both development and installed (pip/pipx) environments;
+        # as_file() materializes a real path even for zip-based installs
+        config_file = files("titan_plugin_github.config").joinpath(f"{agent_name}.toml")
+        with as_file(config_file) as config_path:
+            data = _read_toml(config_path)
 
     # Validate config structure
     if "agent" not in data:
         raise ValueError(f"Missing [agent] section in {config_path}")
 
     # Extract sections
-    agent_meta = data.get("agent", {})
-    prompts = data.get("agent", {}).get("prompts", {})
-    limits = data.get("agent", {}).get("limits", {})
-    features = data.get("agent", {}).get("features", {})
+    agent_meta = data["agent"]
+    prompts = agent_meta.get("prompts", {})
+    limits = agent_meta.get("limits", {})
+    features = agent_meta.get("features", {})
 
     # Build PRAgentConfig
     return PRAgentConfig(
@@ -125,6 +146,7 @@ def load_agent_config(
         enable_user_confirmation=features.get("enable_user_confirmation", True),
         enable_fallback_prompts=features.get("enable_fallback_prompts", True),
         enable_debug_output=features.get("enable_debug_output", False),
+        enable_prompt_caching=features.get("enable_prompt_caching", True),
         # Raw for custom access
         raw=data
     )
@@ -9,8 +9,9 @@ This agent analyzes the complete context of a branch and automatically:
 """
 
 import logging
+import os
+import re
 from dataclasses import dataclass
-from pathlib import Path
 from typing import Optional
 
 from titan_cli.ai.agents.base import BaseAIAgent, AgentRequest
@@ -20,6 +21,150 @@ from ..utils import calculate_pr_size
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Extracts the message from a "COMMIT_MESSAGE: <message>" response line
+_COMMIT_MESSAGE_RE = re.compile(r"^\s*COMMIT_MESSAGE:\s*(.+)$", re.MULTILINE)
+
+# Start of each file section in a git diff, capturing the path
+_DIFF_FILE_RE = re.compile(r"^diff --git a/(.+?) b/", re.MULTILINE)
+
+# Generated/vendored files whose diffs add tokens but no reviewable signal
+_NOISY_PATH_RE = re.compile(
+    r"(^|/)(package-lock\.json|pnpm-lock\.yaml|[^/]+\.lock|[^/]+\.min\.(js|css)|[^/]+\.svg)$"
+    r"|(^|/)(node_modules|dist|__snapshots__)/"
+)
+
+# (max_tokens, temperature) per PR size: small PRs get a tight, near-deterministic
+# budget; larger ones more room for detail
+_PR_GENERATION_PARAMS = {
+    "small": (500, 0.2),
+    "medium": (1000, 0.4),
+    "large": (1800, 0.6),
+    "very large": (3000, 0.7),
+}
+
+# PR format instructions for the system prompt. Static text, only the
+# placeholders change between calls; filled in with str.format
+_PR_TEMPLATE_INSTRUCTIONS = """## PR Template (MUST FOLLOW THIS STRUCTURE)
+```markdown
+{template}
+```
+
+## CRITICAL Instructions
+1. **Title**: Follow conventional commits (type(scope): description), be clear and descriptive
+   - Examples: "feat(auth): add OAuth2 integration with Google provider", "fix(api): resolve race condition in cache invalidation"
+
+2. **Description**: MUST follow the template structure above but keep it under {max_chars} characters total
+   - Fill in the template sections (Summary, Type of Change, Changes Made, etc.)
+   - Mark checkboxes appropriately with [x]
+   - Adjust detail level based on PR size ({pr_size}):
+     * Small PRs: Brief, 1-2 lines per section
+     * Medium PRs: Moderate detail, 2-3 lines per section
+     * Large PRs: Comprehensive, 3-5 lines per section with examples
+     * Very Large PRs: Detailed architecture explanations, migration guides
+   - Total description length MUST be ≤{max_chars} chars
+
+Format your response EXACTLY like this:
+TITLE: <conventional commit title>
+
+DESCRIPTION:
+<template-based description - MAX {max_chars} chars total>"""
+
+_PR_DEFAULT_INSTRUCTIONS = """## Instructions (No template available - use standard format)
+Generate a Pull Request appropriate for a {pr_size} PR:
+1. **Title**: Follow conventional commits (type(scope): description), be clear and descriptive
+   - Examples: "feat(auth): add OAuth2 integration with Google provider", "fix(api): resolve race condition in cache invalidation"
+2. **Description**: CRITICAL - Maximum {max_chars} characters. Detail level based on PR size:
+   - Small ({pr_size}): Brief summary (1-2 sentences) + key changes (2-3 bullets)
+   - Medium: What changed (2-3 sentences) + why (1-2 sentences) + key changes (4-5 bullets)
+   - Large: Comprehensive overview + architecture changes + migration notes + testing strategy
+   - Very Large: Full context + breaking changes + upgrade guide + examples
+
+Format your response EXACTLY like this:
+TITLE: <conventional commit title>
+
+DESCRIPTION:
+<description matching PR size - MAX {max_chars} chars>"""
+
+# PR template contents keyed by resolved path -> (mtime, content)
+_TEMPLATE_CACHE: dict[str, tuple[float, str]] = {}
+
+
+def _load_template(template_path: str) -> Optional[str]:
+    """
+    Read a template file, reusing the cached content while its mtime is unchanged.
+
+    Args:
+        template_path: Path to the template file
+
+    Returns:
+        Template content, or None if the file doesn't exist or can't be read
+    """
+    path = os.path.abspath(template_path)
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        _TEMPLATE_CACHE.pop(path, None)
+        return None
+
+    cached = _TEMPLATE_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    _TEMPLATE_CACHE[path] = (mtime, content)
+    return content
+
+
+def _prune_diff(diff: str, max_chars: int) -> str:
+    """
+    Fit a branch diff into a character budget, dropping noise first.
+
+    Lockfiles, minified/vendored assets and snapshots are removed, then file
+    sections are kept in order until the budget runs out. Files that don't
+    fit are summarized in a trailing line instead of being cut mid-hunk.
+
+    Args:
+        diff: Full branch diff
+        max_chars: Character budget for the result
+
+    Returns:
+        Pruned diff
+    """
+    starts = [m.start() for m in _DIFF_FILE_RE.finditer(diff)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    ends = starts[1:] + [len(diff)]
+
+    kept = []
+    omitted = 0
+    remaining = max_chars
+    for start, end in zip(starts, ends):
+        match = _DIFF_FILE_RE.match(diff, start)
+        if match and _NOISY_PATH_RE.search(match.group(1)):
+            omitted += 1
+            continue
+
+        section = diff[start:end]
+        if len(section) <= remaining:
+            kept.append(section)
+            remaining -= len(section)
+        elif remaining > 0 and not kept:
+            # A single oversized first file: show its beginning
+            kept.append(f"{section[:remaining].rstrip()}\n... (diff truncated for brevity)\n")
+            remaining = 0
+        else:
+            omitted += 1
+
+    result = "".join(kept)
+    if omitted:
+        result = f"{result.rstrip()}\n\n... {omitted} more files omitted"
+    return result
+
 
 @dataclass
 class PRAnalysis:
@@ -88,7 +233,7 @@ class PRAgent(BaseAIAgent):
         self.git = git_client
         self.github = github_client
 
-        # Load configuration from TOML (once per agent instance)
+        # Load configuration from TOML (parsed once per process)
         self.config = load_agent_config("pr_agent")
 
     def get_system_prompt(self) -> str:
@@ -149,9 +294,9 @@ class PRAgent(BaseAIAgent):
                         # Also include untracked files if they exist
                         if status.untracked_files:
                             # Add header for untracked files context
-                            untracked_info = "\n\n# New untracked files:\n"
-                            for file in status.untracked_files:
-                                untracked_info += f"# - {file}\n"
+                            untracked_info = "\n\n# New untracked files:\n" + "".join(
+                                f"# - {file}\n" for file in status.untracked_files
+                            )
                             diff = diff + untracked_info if diff else untracked_info
                     else:
                         diff = self.git.get_staged_diff()
@@ -180,12 +325,11 @@ class PRAgent(BaseAIAgent):
 
         # 2. Analyze branch for PR (with error handling)
         try:
-            commits = self.git.get_branch_commits(base_branch, head_branch)
-            branch_diff = self.git.get_branch_diff(base_branch, head_branch)
+            commits, branch_diff = self.git.get_branch_commits_and_diff(base_branch, head_branch)
 
             if branch_diff and commits:
                 # Read PR template (safe - returns None on error)
-                template = self._read_pr_template()
+                template = self.read_pr_template()
 
                 # Generate PR description (with AI error handling)
                 try:
@@ -260,7 +404,8 @@ COMMIT_MESSAGE: <conventional commit message>"""
         request = AgentRequest(
             context=prompt,
             max_tokens=200,
-            system_prompt=self.config.commit_system_prompt  # Use specific commit prompt
+            system_prompt=self.config.commit_system_prompt,  # Use specific commit prompt
+            cache_system_prompt=self.config.enable_prompt_caching
         )
 
         try:
@@ -269,8 +414,9 @@ COMMIT_MESSAGE: <conventional commit message>"""
             logger.error(f"AI generation failed for commit message: {e}")
             raise
 
-        # Parse response
-        message = response.content.replace("COMMIT_MESSAGE:", "").strip()
+        # Parse response (take the COMMIT_MESSAGE line, ignore any preamble)
+        match = _COMMIT_MESSAGE_RE.search(response.content)
+        message = match.group(1).strip() if match else response.content.strip()
         message = message.strip('"').strip("'")
 
         # Validate message
@@ -324,26 +470,33 @@ COMMIT_MESSAGE: <conventional commit message>"""
         files_changed = estimation.files_changed
         lines_changed = estimation.diff_lines
 
-        # Build prompt
-        prompt = self._build_pr_prompt(
-            commits=commits,
-            diff=diff,
-            head_branch=head_branch,
-            base_branch=base_branch,
+        # Static instructions go in the (cacheable) system prompt; only the
+        # branch-specific context is sent as the user message
+        system_prompt = self._build_pr_system_prompt(
             template=template,
             pr_size=pr_size,
             max_chars=max_chars
         )
+        prompt = self._build_pr_user_prompt(
+            commits=commits,
+            diff=diff,
+            head_branch=head_branch,
+            base_branch=base_branch
+        )
 
-        # Calculate tokens - allow enough for title + description
-        estimated_tokens = int(max_chars * 0.75) + 500
-        max_tokens = min(estimated_tokens, 8000)  # Cap at 8000 tokens
+        # Token budget and temperature scale with PR size
+        max_tokens, temperature = _PR_GENERATION_PARAMS.get(
+            pr_size,
+            (min(int(max_chars * 0.75) + 500, 8000), 0.7)
+        )
 
         # Generate with AI
         request = AgentRequest(
             context=prompt,
             max_tokens=max_tokens,
-            system_prompt=self.config.pr_system_prompt
+            temperature=temperature,
+            system_prompt=system_prompt,
+            cache_system_prompt=self.config.enable_prompt_caching
         )
 
         try:
@@ -365,31 +518,25 @@ COMMIT_MESSAGE: <conventional commit message>"""
         }
 
 
-    def _build_pr_prompt(
+    def _build_pr_user_prompt(
         self,
         commits: list[str],
         diff: str,
         head_branch: str,
-        base_branch: str,
-        template: Optional[str],
-        pr_size: str,
-        max_chars: int
+        base_branch: str
     ) -> str:
-        """Build the prompt for PR generation."""
+        """Build the branch-specific part of the PR prompt."""
         # Prepare commits text
-        commits_text = "\n".join([f"  - {c}" for c in commits[:self.config.max_commits_to_analyze]])
-        if len(commits) > self.config.max_commits_to_analyze:
-            commits_text += f"\n  ... and {len(commits) - self.config.max_commits_to_analyze} more commits"
+        max_commits = self.config.max_commits_to_analyze
+        commits_text = "\n".join(f"  - {c}" for c in commits[:max_commits])
+        extra_commits = len(commits) - max_commits
+        if extra_commits > 0:
+            commits_text += f"\n  ... and {extra_commits} more commits"
 
-        # Limit diff size
-        max_diff = self.config.max_diff_size
-        diff_preview = diff[:max_diff] if diff else "No diff available"
-        if len(diff) > max_diff:
-            diff_preview += "\n\n... (diff truncated for brevity)"
+        # Limit diff size, skipping generated files and whole sections that don't fit
+        diff_preview = _prune_diff(diff, self.config.max_diff_size) if diff else "No diff available"
 
-        # Build prompt based on template availability
-        if template:
-            return f"""Analyze this branch and generate a professional pull request following the EXACT template structure.
+        return f"""Analyze this branch and generate a professional pull request.
 
 ## Branch Information
 - Head branch: {head_branch}
@@ -402,63 +549,33 @@ COMMIT_MESSAGE: <conventional commit message>"""
 ## Branch Diff Preview
 ```diff
 {diff_preview}
-```
-
-## PR Template (MUST FOLLOW THIS STRUCTURE)
-```markdown
-{template}
-```
-
-## CRITICAL Instructions
-1. **Title**: Follow conventional commits (type(scope): description), be clear and descriptive
-   - Examples: "feat(auth): add OAuth2 integration with Google provider", "fix(api): resolve race condition in cache invalidation"
-
-2. **Description**: MUST follow the template structure above but keep it under {max_chars} characters total
-   - Fill in the template sections (Summary, Type of Change, Changes Made, etc.)
-   - Mark checkboxes appropriately with [x]
-   - Adjust detail level based on PR size ({pr_size}):
-     * Small PRs: Brief, 1-2 lines per section
-     * Medium PRs: Moderate detail, 2-3 lines per section
-     * Large PRs: Comprehensive, 3-5 lines per section with examples
-     * Very Large PRs: Detailed architecture explanations, migration guides
-   - Total description length MUST be ≤{max_chars} chars
+```"""
 
-Format your response EXACTLY like this:
-TITLE: <conventional commit title>
+    def _build_pr_system_prompt(
+        self,
+        template: Optional[str],
+        pr_size: str,
+        max_chars: int
+    ) -> str:
+        """
+        Build the system prompt for PR generation.
 
-DESCRIPTION:
-<template-based description - MAX {max_chars} chars total>"""
+        Contains everything that doesn't depend on the branch contents (base
+        prompt, template and format instructions), so it's identical across
+        runs with the same template and PR size and can be served from the
+        provider's prompt cache.
+        """
+        # Build instructions based on template availability
+        if template:
+            instructions = _PR_TEMPLATE_INSTRUCTIONS.format(
+                template=template, pr_size=pr_size, max_chars=max_chars
+            )
         else:
-            return f"""Analyze this branch and generate a professional pull request.
+            instructions = _PR_DEFAULT_INSTRUCTIONS.format(pr_size=pr_size, max_chars=max_chars)
 
-## Branch Information
-- Head branch: {head_branch}
-- Base branch: {base_branch}
-- Total commits: {len(commits)}
-
-## Commits in Branch
-{commits_text}
-
-## Branch Diff Preview
-```diff
-{diff_preview}
-```
-
-## Instructions (No template available - use standard format)
-Generate a Pull Request appropriate for a {pr_size} PR:
-1. **Title**: Follow conventional commits (type(scope): description), be clear and descriptive
-   - Examples: "feat(auth): add OAuth2 integration with Google provider", "fix(api): resolve race condition in cache invalidation"
-2. **Description**: CRITICAL - Maximum {max_chars} characters. Detail level based on PR size:
-   - Small ({pr_size}): Brief summary (1-2 sentences) + key changes (2-3 bullets)
-   - Medium: What changed (2-3 sentences) + why (1-2 sentences) + key changes (4-5 bullets)
-   - Large: Comprehensive overview + architecture changes + migration notes + testing strategy
-   - Very Large: Full context + breaking changes + upgrade guide + examples
-
-Format your response EXACTLY like this:
-TITLE: <conventional commit title>
-
-DESCRIPTION:
-<description matching PR size - MAX {max_chars} chars>"""
+        if self.config.pr_system_prompt:
+            return f"{self.config.pr_system_prompt}\n\n{instructions}"
+        return instructions
 
     def _parse_pr_response(self, content: str, max_chars: int) -> tuple[str, str]:
         """
@@ -467,16 +584,16 @@ DESCRIPTION:
         Returns:
             Tuple of (title, description)
         """
-        if "TITLE:" not in content or "DESCRIPTION:" not in content:
+        head, sep, description = content.partition("DESCRIPTION:")
+        if not sep or "TITLE:" not in head:
             raise ValueError(
                 f"AI response format incorrect. Expected 'TITLE:' and 'DESCRIPTION:' sections.\n"
                 f"Got: {content[:200]}..."
             )
 
         # Extract title and description
-        parts = content.split("DESCRIPTION:", 1)
-        title = parts[0].replace("TITLE:", "").strip()
-        description = parts[1].strip() if len(parts) > 1 else ""
+        title = head.replace("TITLE:", "", 1).strip()
+        description = description.strip()
 
         # Clean up title
         title = title.strip('"').strip("'")
@@ -491,7 +608,7 @@ DESCRIPTION:
 
         return title, description
 
-    def _read_pr_template(self, template_path: str = ".github/pull_request_template.md") -> Optional[str]:
+    def read_pr_template(self, template_path: str = ".github/pull_request_template.md") -> Optional[str]:
         """
         Read PR template if it exists.
 
@@ -501,15 +618,7 @@ DESCRIPTION:
         Returns:
             Template content or None
         """
-        path = Path(template_path)
-        if not path.exists():
-            return None
-
-        try:
-            with open(path, "r") as f:
-                return f.read()
-        except Exception:
-            return None
+        return _load_template(template_path)
 
 
 @dataclass
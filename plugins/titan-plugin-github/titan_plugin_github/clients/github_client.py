@@ -6,6 +6,7 @@ Python client for GitHub operations using gh CLI.
 """
 
 import json
+import re
 import subprocess
 from typing import List, Optional, Dict, Any
 
@@ -28,6 +29,10 @@ from ..exceptions import (
 )
 from ..messages import msg
 
+# Merge commit SHA in `gh pr merge` output: full SHA, then abbreviated
+_FULL_SHA_RE = re.compile(r"\(([a-f0-9]{40})\)")
+_SHORT_SHA_RE = re.compile(r"\(([a-f0-9]{7,})\)")
+
 
 class GitHubClient:
     """
@@ -771,14 +776,12 @@ class GitHubClient:
             # Extract SHA from output
             sha = None
             if result:
-                import re
-
-                sha_match = re.search(r"\(([a-f0-9]{40})\)", result)
+                sha_match = _FULL_SHA_RE.search(result)
                 if sha_match:
                     sha = sha_match.group(1)
                 else:
                     # Try short SHA (7 chars)
-                    sha_match = re.search(r"\(([a-f0-9]{7,})\)", result)
+                    sha_match = _SHORT_SHA_RE.search(result)
                     if sha_match:
                         sha = sha_match.group(1)
 
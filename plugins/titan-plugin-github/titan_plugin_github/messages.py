@@ -51,6 +51,7 @@ class Messages:
 
         class AI:
             AI_NOT_CONFIGURED: str = "AI not configured. Run 'titan ai configure' to enable AI features."
+            AI_NOT_REQUESTED: str = "AI PR description disabled (use_ai=false)"
             GITHUB_CLIENT_NOT_AVAILABLE: str = "GitHub client is not available in the workflow context."
             GIT_CLIENT_NOT_AVAILABLE: str = "Git client is not available in the workflow context."
             MISSING_PR_HEAD_BRANCH: str = "Missing pr_head_branch in context"
@@ -63,6 +64,7 @@ class Messages:
             PR_SIZE_INFO: str = "PR Size: {pr_size} ({files_changed} files, {diff_lines} lines) → Max description: {max_chars} chars"
             FAILED_TO_READ_PR_TEMPLATE: str = "Failed to read PR template: {e}"
             GENERATING_PR_DESCRIPTION: str = "Generating PR description with AI..."
+            USING_CACHED_PR_DESCRIPTION: str = "Using PR description previously generated for this branch state"
             AI_RESPONSE_FORMAT_INCORRECT: str = "AI response format incorrect. Expected 'TITLE:' and 'DESCRIPTION:' sections.\nGot: {response_preview}..."
             AI_GENERATED_TRUNCATING: str = "AI generated {actual_len} chars, truncating to {max_chars}"
             AI_GENERATED_EMPTY_SHORT: str = "AI generated an empty or very short description."
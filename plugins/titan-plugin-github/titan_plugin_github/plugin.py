@@ -1,13 +1,15 @@
 # plugins/titan-plugin-github/titan_plugin_github/plugin.py
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from titan_cli.core.plugins.plugin_base import TitanPlugin
-from titan_cli.core.config import TitanConfig
-from titan_cli.core.secrets import SecretManager
 from titan_cli.core.plugins.models import GitHubPluginConfig
 from .clients.github_client import GitHubClient, GitHubError
 
+if TYPE_CHECKING:
+    from titan_cli.core.config import TitanConfig
+    from titan_cli.core.secrets import SecretManager
+
 
 class GitHubPlugin(TitanPlugin):
     """
@@ -26,7 +28,7 @@ class GitHubPlugin(TitanPlugin):
     def dependencies(self) -> list[str]:
         return ["git"]
 
-    def initialize(self, config: TitanConfig, secrets: SecretManager) -> None:
+    def initialize(self, config: "TitanConfig", secrets: "SecretManager") -> None:
         """
         Initializes the GitHubClient.
         """
@@ -65,7 +67,7 @@ class GitHubPlugin(TitanPlugin):
             repo_name=repo_name # Pass detected/configured name
         )
 
-    def _get_plugin_config(self, config: TitanConfig) -> dict:
+    def _get_plugin_config(self, config: "TitanConfig") -> dict:
         """
         Extract plugin-specific configuration.
         
@@ -6,7 +6,9 @@ Uses PRAgent to analyze branch context and generate PR content.
 """
 
 from rich.markdown import Markdown
+from titan_cli.ai.cache import ResponseCache, make_cache_key
 from titan_cli.engine import WorkflowContext, WorkflowResult, Success, Error, Skip
+from titan_plugin_git.exceptions import GitCommandError
 
 from ..agents import PRAgent
 from ..messages import msg
@@ -28,6 +30,10 @@ def ai_suggest_pr_description(ctx: WorkflowContext) -> WorkflowResult:
 
     Inputs (from ctx.data):
         pr_head_branch (str): The head branch for the PR
+        use_ai (bool, optional): Set to False to skip AI generation. Defaults to True.
+        use_ai_cache (bool, optional): Reuse the PR accepted for the same base/head
+            commits and template in the last hour instead of calling the AI.
+            Defaults to True.
 
     Outputs (saved to ctx.data):
         pr_title (str): AI-generated PR title
@@ -37,9 +43,13 @@ def ai_suggest_pr_description(ctx: WorkflowContext) -> WorkflowResult:
 
     Returns:
         Success: PR description generated
-        Skip: AI not configured or user declined
+        Skip: AI not requested, not configured or user declined
         Error: Failed to generate PR description
     """
+    # Fast path: AI disabled for this workflow run (checked before any UI/client access)
+    if not ctx.get("use_ai", True):
+        return Skip(msg.GitHub.AI.AI_NOT_REQUESTED)
+
     # Show step header
     if ctx.views:
         ctx.views.step_header("ai_pr_description", ctx.current_step, ctx.total_steps)
@@ -80,32 +90,57 @@ def ai_suggest_pr_description(ctx: WorkflowContext) -> WorkflowResult:
             github_client=ctx.github
         )
 
-        # Use PRAgent to analyze and generate PR content
-        if ctx.ui:
-            ctx.ui.text.info(msg.GitHub.AI.GENERATING_PR_DESCRIPTION)
+        # Reuse the PR generated for this exact branch state (same commits + template)
+        cache = ResponseCache("pr_descriptions") if ctx.get("use_ai_cache", True) else None
+        cache_key = None
+        if cache:
+            try:
+                base_sha, head_sha = ctx.git.rev_parse(base_branch, head_branch)
+            except GitCommandError:
+                # Unresolvable branch: generate without the cache
+                cache = None
+            else:
+                cache_key = make_cache_key(base_sha, head_sha, pr_agent.read_pr_template() or "")
+        pr = cache.get(cache_key) if cache else None
+
+        if pr:
+            if ctx.ui:
+                ctx.ui.text.info(msg.GitHub.AI.USING_CACHED_PR_DESCRIPTION)
+        else:
+            # Use PRAgent to analyze and generate PR content
+            if ctx.ui:
+                ctx.ui.text.info(msg.GitHub.AI.GENERATING_PR_DESCRIPTION)
 
-        analysis = pr_agent.analyze_and_plan(
-            head_branch=head_branch,
-            base_branch=base_branch,
-            auto_stage=False  # Only analyze branch commits, not uncommitted changes
-        )
+            analysis = pr_agent.analyze_and_plan(
+                head_branch=head_branch,
+                base_branch=base_branch,
+                auto_stage=False  # Only analyze branch commits, not uncommitted changes
+            )
 
-        # Check if PR content was generated (need commits in branch)
-        if not analysis.pr_title or not analysis.pr_body:
-            if ctx.ui:
-                ctx.ui.panel.print(
-                    "No commits found in branch to generate PR description.",
-                    panel_type="info"
-                )
-                ctx.ui.spacer.small()
-            return Skip("No commits found for PR generation")
+            # Check if PR content was generated (need commits in branch)
+            if not analysis.pr_title or not analysis.pr_body:
+                if ctx.ui:
+                    ctx.ui.panel.print(
+                        "No commits found in branch to generate PR description.",
+                        panel_type="info"
+                    )
+                    ctx.ui.spacer.small()
+                return Skip("No commits found for PR generation")
+
+            pr = {
+                "pr_title": analysis.pr_title,
+                "pr_body": analysis.pr_body,
+                "pr_size": analysis.pr_size,
+                "files_changed": analysis.files_changed,
+                "lines_changed": analysis.lines_changed,
+            }
 
         # Show PR size info
-        if ctx.ui and analysis.pr_size:
+        if ctx.ui and pr["pr_size"]:
             ctx.ui.text.info(msg.GitHub.AI.PR_SIZE_INFO.format(
-                pr_size=analysis.pr_size,
-                files_changed=analysis.files_changed,
-                diff_lines=analysis.lines_changed,
+                pr_size=pr["pr_size"],
+                files_changed=pr["files_changed"],
+                diff_lines=pr["lines_changed"],
                 max_chars="varies by size"
             ))
 
@@ -117,12 +152,12 @@ def ai_suggest_pr_description(ctx: WorkflowContext) -> WorkflowResult:
 
             # Show title
             ctx.ui.text.body(msg.GitHub.AI.TITLE_LABEL, style="bold")
-            ctx.ui.text.body(f"  {analysis.pr_title}", style="cyan")
+            ctx.ui.text.body(f"  {pr['pr_title']}", style="cyan")
 
             # Warn if title is too long
-            if len(analysis.pr_title) > 72:
+            if len(pr["pr_title"]) > 72:
                 ctx.ui.text.warning(msg.GitHub.AI.TITLE_TOO_LONG_WARNING.format(
-                    length=len(analysis.pr_title)
+                    length=len(pr["pr_title"])
                 ))
 
             ctx.ui.spacer.small()
@@ -130,7 +165,7 @@ def ai_suggest_pr_description(ctx: WorkflowContext) -> WorkflowResult:
             # Show description
             ctx.ui.text.body(msg.GitHub.AI.DESCRIPTION_LABEL, style="bold")
             ctx.ui.panel.print(
-                Markdown(analysis.pr_body),
+                Markdown(pr["pr_body"]),
                 title=None,
                 panel_type="default"
             )
@@ -144,9 +179,15 @@ def ai_suggest_pr_description(ctx: WorkflowContext) -> WorkflowResult:
             )
 
             if not use_ai_pr:
+                # Don't offer the same rejected PR again on the next run
+                if cache:
+                    cache.delete(cache_key)
                 ctx.ui.text.warning(msg.GitHub.AI.AI_SUGGESTION_REJECTED)
                 return Skip("User rejected AI-generated PR")
 
+        if cache:
+            cache.set(cache_key, pr)
+
         # Show success panel
         if ctx.ui:
             ctx.ui.panel.print(
@@ -158,9 +199,9 @@ def ai_suggest_pr_description(ctx: WorkflowContext) -> WorkflowResult:
         # Success - save to context
         metadata = {
             "ai_generated": True,
-            "pr_title": analysis.pr_title,
-            "pr_body": analysis.pr_body,
-            "pr_size": analysis.pr_size
+            "pr_title": pr["pr_title"],
+            "pr_body": pr["pr_body"],
+            "pr_size": pr["pr_size"]
         }
 
         return Success(
@@ -39,7 +39,7 @@ def create_pr_step(ctx: WorkflowContext) -> WorkflowResult:
     head = ctx.get("pr_head_branch")
     is_draft = ctx.get("pr_is_draft", False)  # Default to not a draft
 
-    if not all([title, base, head]):
+    if not (title and base and head):
         return Error(
             "Missing required context for creating a pull request: pr_title, pr_head_branch."
         )
@@ -10,6 +10,9 @@ DEFAULT_MAX_DIFF_SIZE = 8000  # Characters
 DEFAULT_MAX_FILES_IN_DIFF = 50
 DEFAULT_MAX_COMMITS_TO_ANALYZE = 15
 
+# File headers in a git diff
+_DIFF_FILE_RE = re.compile(r'^diff --git ', re.MULTILINE)
+
 
 @dataclass
 class PRSizeEstimation:
@@ -47,11 +50,10 @@ def calculate_pr_size(diff: str) -> PRSizeEstimation:
         >>> print(estimation.pr_size)
         'small'
     """
-    diff_lines = len(diff.split('\n'))
+    diff_lines = diff.count('\n') + 1
 
     # Count files changed (count file headers in diff)
-    file_pattern = r'^diff --git'
-    files_changed = len(re.findall(file_pattern, diff, re.MULTILINE))
+    files_changed = sum(1 for _ in _DIFF_FILE_RE.finditer(diff))
 
     # Dynamic character limit based on PR size
     if files_changed <= 3 and diff_lines < 100:
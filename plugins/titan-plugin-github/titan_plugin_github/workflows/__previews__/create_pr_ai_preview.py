@@ -69,6 +69,8 @@ def create_create_pr_ai_mock_context() -> WorkflowContext:
     # This simulates data that would come from command-line or earlier setup
     ctx.set("base_branch", "master")
     ctx.set("draft", False)
+    # Mocked AI output must not land in the user's real AI cache
+    ctx.set("use_ai_cache", False)
 
     return ctx
 
@@ -5,6 +5,8 @@ Pytest configuration and shared fixtures for JIRA plugin tests
 import pytest
 from unittest.mock import Mock
 
+from titan_cli.core.secrets import SecretManager
+
 
 @pytest.fixture
 def mock_jira_client():
@@ -17,6 +19,17 @@ def mock_jira_client():
     return client
 
 
+@pytest.fixture(scope="session")
+def mock_secrets():
+    """
+    Shared SecretManager double.
+
+    Avoids a real SecretManager loading the cwd's .titan/secrets.env into
+    os.environ. Safe to share: tests never configure or assert on it.
+    """
+    return Mock(spec=SecretManager)
+
+
 @pytest.fixture
 def mock_workflow_context():
     """Create a mock WorkflowContext for testing steps"""
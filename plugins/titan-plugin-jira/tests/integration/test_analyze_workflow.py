@@ -7,7 +7,14 @@ These tests verify the complete workflow execution with mocked JIRA API response
 import pytest
 from unittest.mock import MagicMock, Mock
 from titan_cli.engine import WorkflowContextBuilder, Success, Error, Skip
-from titan_cli.core.secrets import SecretManager
+from titan_cli.engine.ui_container import UIComponents
+from titan_cli.engine.views_container import UIViews
+from titan_cli.ui.components.typography import TextRenderer
+from titan_cli.ui.components.panel import PanelRenderer
+from titan_cli.ui.components.table import TableRenderer
+from titan_cli.ui.components.spacer import SpacerRenderer
+from titan_cli.ui.views.prompts import PromptsRenderer
+from titan_cli.ui.views.menu_components.menu import MenuRenderer
 from titan_plugin_jira.models import JiraTicket
 
 
@@ -141,21 +148,21 @@ This is a critical authentication bug affecting user login functionality.
 @pytest.fixture
 def mock_ui_components():
     """Mock UI components."""
-    ui = MagicMock()
-    ui.text = MagicMock()
-    ui.panel = MagicMock()
-    ui.table = MagicMock()
-    ui.spacer = MagicMock()
+    # spec'd mocks fail on calls to methods the real renderers don't have
+    ui = MagicMock(spec=UIComponents)
+    ui.text = MagicMock(spec=TextRenderer)
+    ui.panel = MagicMock(spec=PanelRenderer)
+    ui.table = MagicMock(spec=TableRenderer)
+    ui.spacer = MagicMock(spec=SpacerRenderer)
     return ui
 
 
 @pytest.fixture
 def mock_views():
     """Mock UI views."""
-    views = MagicMock()
-    views.prompts = MagicMock()
-    views.menu = MagicMock()
-    views.step_header = MagicMock()
+    views = MagicMock(spec=UIViews)
+    views.prompts = MagicMock(spec=PromptsRenderer)
+    views.menu = MagicMock(spec=MenuRenderer)
 
     # Mock user selecting issue #1 (ask_int returns integer)
     views.prompts.ask_int.return_value = 1
@@ -164,13 +171,11 @@ def mock_views():
 
 
 @pytest.fixture
-def workflow_context(mock_jira_client, mock_ai_client, mock_ui_components, mock_views):
+def workflow_context(mock_jira_client, mock_ai_client, mock_ui_components, mock_views, mock_secrets):
     """Build workflow context with mocked dependencies."""
-    secrets = SecretManager()
-
     ctx = WorkflowContextBuilder(
         plugin_registry=None,  # Not needed for this test
-        secrets=secrets,
+        secrets=mock_secrets,
         ai_config=None
     ).build()
 
@@ -1,13 +1,15 @@
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from titan_cli.core.plugins.models import JiraPluginConfig
 from titan_cli.core.plugins.plugin_base import TitanPlugin
-from titan_cli.core.config import TitanConfig
-from titan_cli.core.secrets import SecretManager
 from .clients.jira_client import JiraClient
 from .exceptions import JiraConfigurationError, JiraClientError
 from .messages import msg
 
+if TYPE_CHECKING:
+    from titan_cli.core.config import TitanConfig
+    from titan_cli.core.secrets import SecretManager
+
 
 class JiraPlugin(TitanPlugin):
     """
@@ -27,7 +29,7 @@ class JiraPlugin(TitanPlugin):
     def dependencies(self) -> list[str]:
         return []
 
-    def initialize(self, config: TitanConfig, secrets: SecretManager) -> None:
+    def initialize(self, config: "TitanConfig", secrets: "SecretManager") -> None:
         """
         Initialize with configuration.
 
@@ -73,7 +75,7 @@ class JiraPlugin(TitanPlugin):
             cache_ttl=validated_config.cache_ttl
         )
 
-    def _get_plugin_config(self, config: TitanConfig) -> dict:
+    def _get_plugin_config(self, config: "TitanConfig") -> dict:
         """
         Extract plugin-specific configuration.
 
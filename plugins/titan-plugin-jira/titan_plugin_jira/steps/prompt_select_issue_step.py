@@ -25,17 +25,6 @@ def prompt_select_issue_step(ctx: WorkflowContext) -> WorkflowResult:
     if not issues:
         return Error(msg.Steps.PromptSelectIssue.NO_ISSUES_AVAILABLE)
 
-    if len(issues) == 0:
-        return Error(msg.Steps.PromptSelectIssue.NO_ISSUES_AVAILABLE)
-
-    # Build choices list
-    choices = []
-    for issue in issues:
-        assignee = issue.assignee or "Unassigned"
-        # Format: "KEY [STATUS] Summary (Assignee | Type)"
-        choice = f"{issue.key} [{issue.status}] {issue.summary[:60]} ({assignee} | {issue.issue_type})"
-        choices.append(choice)
-
     # Prompt user to select issue
     if ctx.views:
         # Ask for selection (issues already displayed in table from previous step)
@@ -45,7 +34,7 @@ def prompt_select_issue_step(ctx: WorkflowContext) -> WorkflowResult:
         selected_index = ctx.views.prompts.ask_int(
             msg.Steps.PromptSelectIssue.ASK_ISSUE_NUMBER,
             min_value=1,
-            max_value=len(choices)
+            max_value=len(issues)
         )
 
         if selected_index is None:
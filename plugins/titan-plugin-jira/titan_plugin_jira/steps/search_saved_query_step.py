@@ -214,8 +214,10 @@ def search_saved_query_step(ctx: WorkflowContext) -> WorkflowResult:
                 # If table rendering fails, show error but continue with raw issue list
                 ctx.ui.text.error(f"Error rendering table: {e}")
                 ctx.ui.text.info(f"Found {len(issues)} issues (showing raw data)")
-                for i, issue in enumerate(issues, 1):
-                    ctx.ui.text.body(f"{i}. {issue.key} - {getattr(issue, 'summary', 'N/A')}")
+                ctx.ui.text.body("\n".join(
+                    f"{i}. {issue.key} - {getattr(issue, 'summary', 'N/A')}"
+                    for i, issue in enumerate(issues, 1)
+                ))
                 ctx.ui.spacer.small()
 
         return Success(
@@ -4,28 +4,33 @@ from titan_cli.ai.models import AIMessage, AIRequest, AIResponse
 from titan_cli.ai.providers import AnthropicProvider
 from titan_cli.ai.exceptions import AIProviderError
 
+def _mock_create(**kwargs):
+    """Stand-in for anthropic's messages.create."""
+    # Check for error condition within the messages passed to create
+    for msg in kwargs.get("messages", []):
+        if "error" in msg.get("content", "").lower():
+            raise Exception("Mock Anthropic Error")
+
+    # Simulate messages.create response structure
+    mock_message = MagicMock()
+    mock_message.content = [MagicMock(text="Mocked Anthropic Response")]
+    mock_message.model = kwargs.get("model", "claude-sonnet")
+    mock_message.usage = MagicMock(
+        input_tokens=10,
+        output_tokens=20,
+        cache_read_input_tokens=0,
+        cache_creation_input_tokens=0,
+    )
+    mock_message.stop_reason = "end_turn"
+    return mock_message
+
+
 # Mock for the actual client library (e.g., Anthropic's client)
 class MockAnthropicClient:
     def __init__(self, base_url="https://api.anthropic.com"):
         self.base_url = base_url
         self.messages = MagicMock() # Make messages an object
-
-        # Define the create method on the messages mock object
-        def mock_create(**kwargs):
-            # Check for error condition within the messages passed to create
-            for msg in kwargs.get("messages", []):
-                if "error" in msg.get("content", "").lower():
-                    raise Exception("Mock Anthropic Error")
-
-            # Simulate messages.create response structure
-            mock_message = MagicMock()
-            mock_message.content = [MagicMock(text="Mocked Anthropic Response")]
-            mock_message.model = kwargs.get("model", "claude-sonnet")
-            mock_message.usage = MagicMock(input_tokens=10, output_tokens=20)
-            mock_message.stop_reason = "end_turn"
-            return mock_message
-        
-        self.messages.create.side_effect = mock_create
+        self.messages.create.side_effect = _mock_create
 
 @pytest.fixture
 def mock_anthropic_client_lib(mocker):
@@ -91,3 +96,21 @@ def test_anthropic_generate_error_handling(mock_anthropic_client_lib, mock_anthr
 
     with pytest.raises(AIProviderError, match="Anthropic API error: Mock Anthropic Error"):
         provider.generate(request)
+
+
+def test_anthropic_generate_caches_system_prompt_when_requested(mock_anthropic_client_lib, mock_anthropic_provider_config):
+    """Test that the system prompt is sent as a cacheable block only when requested."""
+    provider = AnthropicProvider(**mock_anthropic_provider_config)
+    create = mock_anthropic_client_lib.return_value.messages.create
+    messages = [AIMessage(role="system", content="Static instructions"), AIMessage(role="user", content="Hello")]
+
+    response = provider.generate(AIRequest(messages=messages, cache_system_prompt=True))
+
+    assert create.call_args.kwargs["system"] == [
+        {"type": "text", "text": "Static instructions", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert create.call_args.kwargs["messages"] == [{"role": "user", "content": "Hello"}]
+    assert response.usage["cache_read_input_tokens"] == 0
+
+    provider.generate(AIRequest(messages=messages))
+    assert create.call_args.kwargs["system"] == "Static instructions"
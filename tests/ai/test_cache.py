@@ -0,0 +1,46 @@
+import json
+
+from titan_cli.ai.cache import ResponseCache, make_cache_key
+
+
+def test_make_cache_key_is_stable_and_distinguishes_parts():
+    """Same inputs give the same key; splitting the input differently does not."""
+    assert make_cache_key("prompt") == make_cache_key("prompt")
+    assert make_cache_key("ab", "c") != make_cache_key("a", "bc")
+
+
+def test_cache_roundtrip(tmp_path):
+    """Stored values are returned on the next lookup."""
+    cache = ResponseCache("commit_messages", cache_dir=tmp_path)
+    key = make_cache_key("diff")
+
+    assert cache.get(key) is None
+    cache.set(key, "feat(core): add cache")
+
+    assert cache.get(key) == "feat(core): add cache"
+    assert (tmp_path / "commit_messages" / f"{key}.json").is_file()
+
+
+def test_cache_expired_entry_is_a_miss(tmp_path):
+    """Entries older than the TTL are ignored."""
+    cache = ResponseCache("commit_messages", cache_dir=tmp_path, ttl=60)
+    key = make_cache_key("diff")
+    cache.set(key, "old message")
+
+    entry_path = tmp_path / "commit_messages" / f"{key}.json"
+    entry_path.write_text(json.dumps({"created_at": 0, "value": "old message"}))
+
+    assert cache.get(key) is None
+
+
+def test_cache_delete_and_corrupt_entries(tmp_path):
+    """Deleted and unreadable entries behave as misses."""
+    cache = ResponseCache("commit_messages", cache_dir=tmp_path)
+    key = make_cache_key("diff")
+    cache.set(key, "message")
+    cache.delete(key)
+    assert cache.get(key) is None
+
+    cache.delete(key)  # Deleting a missing key is a no-op
+    (tmp_path / "commit_messages" / f"{key}.json").write_text("not json")
+    assert cache.get(key) is None
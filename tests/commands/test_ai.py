@@ -1,6 +1,5 @@
 import pytest
 from unittest.mock import MagicMock, patch
-from typer.testing import CliRunner
 from titan_cli.commands.ai import list_providers, set_default_provider, _test_ai_connection_by_id
 from titan_cli.core.models import TitanConfigModel, AIConfig, AIProviderConfig
 from titan_cli.core.config import TitanConfig
@@ -47,17 +46,11 @@ def test_list_providers(mock_titan_config, capsys):
     assert "Corporate Gemini" in captured.out
     assert "⭐" in captured.out
 
-@pytest.fixture
-def runner():
-    return CliRunner()
-
-# ... (other fixtures)
-
 @patch('titan_cli.commands.ai.TitanConfig')
 @patch('builtins.open', create=True)
 @patch('tomli.load')
 @patch('tomli_w.dump')
-def test_set_default_provider(mock_dump, mock_load, mock_open, mock_titan_config_class, runner):
+def test_set_default_provider(mock_dump, mock_load, mock_open, mock_titan_config_class):
     """Test the set_default_provider function."""
     # Setup mock config
     mock_config = mock_titan_config_class.return_value
@@ -1,4 +1,5 @@
 # tests/core/test_plugin_registry.py
+import pytest
 from unittest.mock import MagicMock
 from titan_cli.core.plugins.plugin_registry import PluginRegistry
 from titan_cli.core.errors import PluginLoadError
@@ -42,6 +43,14 @@ class MockDependentPlugin(MockPlugin):
     _dependencies = ["plugin_one"]
 
 
+@pytest.fixture(autouse=True)
+def fresh_entry_points():
+    """Make every test see its own patched entry_points()."""
+    PluginRegistry.refresh_cache()
+    yield
+    PluginRegistry.refresh_cache()
+
+
 def test_plugin_registry_discovery_success(mocker):
     """
     Test that PluginRegistry successfully discovers and loads plugins.
@@ -76,7 +85,7 @@ def test_plugin_registry_discovery_success(mocker):
     assert plugin_instance.name == "plugin_one"
 
 
-def test_plugin_registry_handles_load_failure(mocker, capsys):
+def test_plugin_registry_handles_load_failure(mocker):
     """
     Test that PluginRegistry gracefully handles a plugin that fails to load or is invalid.
     """
@@ -207,3 +216,43 @@ def test_plugin_registry_plugin_initialization_context(mocker):
     assert plugin_instance.received_config is mock_config
     assert plugin_instance.received_secrets is mock_secrets
 
+
+
+def test_plugin_registry_scans_entry_points_once(mocker):
+    """
+    Test that entry points are scanned once and rescanned only after refresh_cache().
+    """
+    mock_entry_points = mocker.patch(
+        "titan_cli.core.plugins.plugin_registry.entry_points",
+        return_value=[]
+    )
+
+    PluginRegistry()
+    PluginRegistry().reset()
+    assert mock_entry_points.call_count == 1
+
+    PluginRegistry.refresh_cache()
+    PluginRegistry()
+    assert mock_entry_points.call_count == 2
+
+
+def test_plugin_registry_loads_plugins_on_first_use(mocker):
+    """
+    Test that plugin modules are only imported once the registry is queried.
+    """
+    mock_ep = MagicMock()
+    mock_ep.name = "plugin_one"
+    mock_ep.load.return_value = type("PluginOne", (MockPlugin,), {"_name": "plugin_one"})
+    mocker.patch(
+        "titan_cli.core.plugins.plugin_registry.entry_points",
+        return_value=[mock_ep]
+    )
+
+    registry = PluginRegistry()
+    registry.reset()
+    assert registry.list_discovered() == ["plugin_one"]
+    mock_ep.load.assert_not_called()
+
+    assert registry.list_installed() == ["plugin_one"]
+    assert registry.get_plugin("plugin_one") is not None
+    mock_ep.load.assert_called_once()
@@ -22,14 +22,10 @@ def mock_ui_components():
 
 @pytest.fixture
 def mock_registry():
-    """Fixture to mock PluginRegistry."""
-    # We patch the class to avoid actual discovery
-    with patch('titan_cli.core.project_init.PluginRegistry') as mock_registry_class:
-        mock_registry_instance = MagicMock(spec=PluginRegistry)
-        mock_registry_instance.list_discovered.return_value = ['git', 'github']
-        # The class constructor returns our instance
-        mock_registry_class.return_value = mock_registry_instance
-        yield mock_registry_instance
+    """Fixture to mock the PluginRegistry passed to initialize_project."""
+    mock_registry_instance = MagicMock(spec=PluginRegistry)
+    mock_registry_instance.list_discovered.return_value = ['git', 'github']
+    return mock_registry_instance
 
 
 def test_initialize_project_success(mock_ui_components, mock_registry):
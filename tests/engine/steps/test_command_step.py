@@ -6,6 +6,8 @@ from titan_cli.engine.steps.command_step import execute_command_step
 from titan_cli.core.workflows.models import WorkflowStepModel
 from titan_cli.engine.context import WorkflowContext
 from titan_cli.engine.results import Success, Error
+from titan_cli.engine.ui_container import UIComponents
+from titan_cli.ui.components.typography import TextRenderer
 
 # --- Fixtures ---
 
@@ -13,8 +15,8 @@ from titan_cli.engine.results import Success, Error
 def mock_context():
     """Provides a mock WorkflowContext."""
     ctx = MagicMock(spec=WorkflowContext)
-    ctx.ui = MagicMock()
-    ctx.ui.text = MagicMock()
+    ctx.ui = MagicMock(spec=UIComponents)
+    ctx.ui.text = MagicMock(spec=TextRenderer)
     ctx.get.side_effect = lambda key, default=None: {"cwd": "/tmp/mock_cwd"}.get(key, default)
     return ctx
 
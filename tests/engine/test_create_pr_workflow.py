@@ -1,5 +1,6 @@
 # tests/engine/test_create_pr_workflow.py
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 from pathlib import Path
 from titan_cli.core.config import TitanConfig
@@ -60,7 +61,7 @@ def test_create_pr_workflow_e2e(mock_titan_config, create_pr_workflow_yaml):
     # Create mock steps that return Success with proper metadata
     def create_git_status_step(ctx):
         return Success("Status checked", metadata={
-            "git_status": MagicMock(is_clean=False)
+            "git_status": SimpleNamespace(is_clean=False)
         })
 
     def create_prompt_commit_step(ctx):
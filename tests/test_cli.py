@@ -1,5 +1,6 @@
 # tests/test_cli.py
 import pytest
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 
@@ -48,13 +49,13 @@ def test_show_interactive_menu_configure_flow(mock_dependencies):
     config_instance = mock_dependencies["config_instance"]
 
     # --- Simulation Setup ---
-    projects_menu_choice = MagicMock(action="projects")
-    main_menu_choice = MagicMock(action="configure")
+    projects_menu_choice = SimpleNamespace(action="projects")
+    main_menu_choice = SimpleNamespace(action="configure")
     unconfigured_path = Path("/fake/projects/new-project")
     discover_mock.return_value = ([], [unconfigured_path])
-    project_menu_choice = MagicMock(action=str(unconfigured_path.resolve()))
-    exit_choice = MagicMock(action="exit")
-    back_choice = MagicMock(action="back")
+    project_menu_choice = SimpleNamespace(action=str(unconfigured_path.resolve()))
+    exit_choice = SimpleNamespace(action="exit")
+    back_choice = SimpleNamespace(action="back")
 
     # Sequence of user choices: Projects -> Configure -> Select Project -> Back to main -> Exit
     prompts_mock.ask_menu.side_effect = [
@@ -85,10 +86,10 @@ def test_show_interactive_menu_list_flow(mock_dependencies):
     list_projects_mock = mock_dependencies["list_projects"]
 
     # Sequence of choices: Projects -> List -> Back to main -> Exit
-    projects_choice = MagicMock(action="projects")
-    list_choice = MagicMock(action="list")
-    exit_choice = MagicMock(action="exit")
-    back_choice = MagicMock(action="back")
+    projects_choice = SimpleNamespace(action="projects")
+    list_choice = SimpleNamespace(action="list")
+    exit_choice = SimpleNamespace(action="exit")
+    back_choice = SimpleNamespace(action="back")
     prompts_mock.ask_menu.side_effect = [projects_choice, list_choice, back_choice, exit_choice]
     prompts_mock.ask_confirm.return_value = True # For the "Return to main menu?" pause
 
@@ -109,10 +110,10 @@ def test_show_interactive_menu_no_unconfigured_projects(mock_dependencies):
     init_project_mock = mock_dependencies["init_project"]
     
     # Sequence of choices: Projects -> Configure -> Back to main -> Exit
-    projects_choice = MagicMock(action="projects")
-    configure_choice = MagicMock(action="configure")
-    exit_choice = MagicMock(action="exit")
-    back_choice = MagicMock(action="back")
+    projects_choice = SimpleNamespace(action="projects")
+    configure_choice = SimpleNamespace(action="configure")
+    exit_choice = SimpleNamespace(action="exit")
+    back_choice = SimpleNamespace(action="back")
     prompts_mock.ask_menu.side_effect = [projects_choice, configure_choice, back_choice, exit_choice]
     prompts_mock.ask_confirm.return_value = True # For the "Return to main menu?" pause
 
@@ -125,7 +126,4 @@ def test_show_interactive_menu_no_unconfigured_projects(mock_dependencies):
     # --- Assertions ---
     init_project_mock.assert_not_called()
     assert prompts_mock.ask_menu.call_count == 4 # Main -> Projects -> Projects Sub -> Main -> Exit
-    
-    # --- Debugging ---
-    print(prompts_mock.ask_confirm.call_args_list)
     prompts_mock.ask_confirm.assert_called()
@@ -8,7 +8,7 @@ def mock_console():
     """Fixture for a mocked Rich Console."""
     return MagicMock()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_menu():
     """Fixture for a sample Menu object."""
     return Menu(
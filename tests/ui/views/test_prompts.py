@@ -19,7 +19,7 @@ def mock_menu_renderer(mocker):
     """Fixture to create a mock MenuRenderer."""
     return mocker.MagicMock(spec=MenuRenderer)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_menu():
     """Fixture for a sample Menu object for testing ask_menu."""
     return Menu(
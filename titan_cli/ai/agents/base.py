@@ -15,6 +15,7 @@ class AgentRequest:
     max_tokens: int = 2000
     temperature: float = 0.7
     system_prompt: Optional[str] = None
+    cache_system_prompt: bool = False
 
 
 @dataclass
@@ -40,7 +41,8 @@ class AIGenerator(Protocol):
         self,
         messages: List[AIMessage],
         max_tokens: Optional[int] = None,
-        temperature: Optional[float] = None
+        temperature: Optional[float] = None,
+        cache_system_prompt: bool = False
     ) -> AIResponse:
         """
         Generate AI response from messages.
@@ -49,6 +51,7 @@ class AIGenerator(Protocol):
             messages: List of AIMessage objects
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
+            cache_system_prompt: Request provider-side caching of the system prompt
 
         Returns:
             AIResponse object with content and metadata
@@ -116,7 +119,8 @@ class BaseAIAgent(ABC):
         response = self.generator.generate(
             messages=messages,
             max_tokens=request.max_tokens,
-            temperature=request.temperature
+            temperature=request.temperature,
+            cache_system_prompt=request.cache_system_prompt
         )
 
         # Convert to AgentResponse
@@ -133,6 +137,9 @@ class BaseAIAgent(ABC):
         else:
             tokens_used = 0
 
+        # Tokens served from the provider's prompt cache (if supported)
+        cached_tokens = response.usage.get("cache_read_input_tokens", 0) if response.usage else 0
+
         # Get provider name safely
         try:
             provider_obj = getattr(self.generator, '_provider', self.generator)
@@ -144,7 +151,7 @@ class BaseAIAgent(ABC):
             content=response.content,
             tokens_used=tokens_used,
             provider=provider_name,
-            cached=False
+            cached=bool(cached_tokens)
         )
 
     def is_available(self) -> bool:
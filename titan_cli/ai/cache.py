@@ -0,0 +1,123 @@
+"""
+On-disk cache for AI responses.
+
+Entries are content-addressed: the key is a hash of the prompt (or any other
+inputs that fully determine the request), so re-running a workflow on an
+unchanged diff can reuse the previous result instead of calling the provider.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".titan" / "cache" / "ai"
+DEFAULT_TTL_SECONDS = 3600
+
+
+def make_cache_key(*parts: str) -> str:
+    """
+    Build a cache key from the inputs of an AI request.
+
+    Args:
+        *parts: Strings that determine the response (prompt, model, ...)
+
+    Returns:
+        Hex digest identifying the request
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """
+    JSON file cache for AI results, one file per key.
+
+    Cache failures are never fatal: unreadable or expired entries are
+    treated as misses and write errors are ignored.
+
+    Examples:
+        >>> cache = ResponseCache("commit_messages")
+        >>> key = make_cache_key(prompt)
+        >>> message = cache.get(key)
+        >>> if message is None:
+        ...     message = generate(prompt)
+        ...     cache.set(key, message)
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        cache_dir: Optional[Path] = None,
+        ttl: int = DEFAULT_TTL_SECONDS
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            namespace: Subdirectory that groups related entries
+            cache_dir: Base cache directory (default: ~/.titan/cache/ai)
+            ttl: Seconds an entry stays valid
+        """
+        self.path = (cache_dir or DEFAULT_CACHE_DIR) / namespace
+        self.ttl = ttl
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key (see make_cache_key)
+
+        Returns:
+            Cached value, or None on miss or expiry
+        """
+        try:
+            with open(self._entry_path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get("created_at", 0) > self.ttl:
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a JSON-serializable value.
+
+        Args:
+            key: Cache key (see make_cache_key)
+            value: Value to store
+        """
+        entry_path = self._entry_path(key)
+        tmp_path = entry_path.with_suffix(".tmp")
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"created_at": time.time(), "value": value}, f)
+            # Atomic rename so concurrent readers never see a partial file
+            os.replace(tmp_path, entry_path)
+        except (OSError, TypeError):
+            pass
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a cached value, if present.
+
+        Args:
+            key: Cache key (see make_cache_key)
+        """
+        try:
+            self._entry_path(key).unlink()
+        except OSError:
+            pass
@@ -8,12 +8,14 @@ from titan_cli.core.models import AIConfig
 from titan_cli.core.secrets import SecretManager
 from .exceptions import AIConfigurationError
 from .models import AIMessage, AIRequest, AIResponse
-from .providers import AIProvider, AnthropicProvider, GeminiProvider
+from . import providers
+from .providers import AIProvider
 
-# A mapping from provider names to classes
+# A mapping from provider names to provider class names. Classes are resolved
+# on first use so that only the SDK of the configured provider is imported.
 PROVIDER_CLASSES = {
-    "anthropic": AnthropicProvider,
-    "gemini": GeminiProvider,
+    "anthropic": "AnthropicProvider",
+    "gemini": "GeminiProvider",
 }
 
 class AIClient:
@@ -47,7 +49,7 @@ class AIClient:
             self.provider_id = requested_id
         elif ai_config.providers:
             # Fallback to first available provider
-            self.provider_id = list(ai_config.providers.keys())[0]
+            self.provider_id = next(iter(ai_config.providers))
         else:
             raise AIConfigurationError("No AI providers configured.")
 
@@ -72,10 +74,11 @@ class AIClient:
             raise AIConfigurationError(f"AI provider '{self.provider_id}' not found in configuration.")
 
         provider_name = provider_config.provider
-        provider_class = PROVIDER_CLASSES.get(provider_name)
+        provider_class_name = PROVIDER_CLASSES.get(provider_name)
 
-        if not provider_class:
+        if not provider_class_name:
             raise AIConfigurationError(f"Unknown AI provider type: {provider_name}")
+        provider_class = getattr(providers, provider_class_name)
 
         # Get API key
         api_key_name = f"{self.provider_id}_api_key"
@@ -96,6 +99,7 @@ class AIClient:
         messages: List[AIMessage],
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
+        cache_system_prompt: bool = False,
     ) -> AIResponse:
         """
         Generate response using configured AI provider.
@@ -104,6 +108,8 @@ class AIClient:
             messages: List of conversation messages.
             max_tokens: Optional override for the maximum number of tokens.
             temperature: Optional override for the temperature.
+            cache_system_prompt: Ask the provider to cache the system prompt
+                (ignored by providers without prompt caching).
 
         Returns:
             AI response with generated content.
@@ -116,6 +122,7 @@ class AIClient:
             messages=messages,
             max_tokens=max_tokens if max_tokens is not None else provider_cfg.max_tokens,
             temperature=temperature if temperature is not None else provider_cfg.temperature,
+            cache_system_prompt=cache_system_prompt,
         )
         return self.provider.generate(request)
 
@@ -23,6 +23,7 @@ class AIRequest:
     messages: List[AIMessage]
     max_tokens: int = 4096
     temperature: float = 0.7
+    cache_system_prompt: bool = False  # Ask providers that support it to cache the system prompt
 
 
 @dataclass
@@ -1,9 +1,35 @@
+"""
+AI providers
+
+Provider modules are imported on first attribute access (PEP 562). This is
+not done for the small pure-Python helpers elsewhere: it is here because
+gemini imports google.generativeai at module level (about 250 ms), which
+eager imports would add to every CLI start, even when AI is never used.
+"""
+
+from importlib import import_module
+
 from .base import AIProvider
-from .anthropic import AnthropicProvider
-from .gemini import GeminiProvider
+
+_LAZY_ATTRS = {
+    "AnthropicProvider": ".anthropic",
+    "GeminiProvider": ".gemini",
+}
 
 __all__ = [
     "AIProvider",
     "AnthropicProvider",
     "GeminiProvider",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -76,7 +76,15 @@ class AnthropicProvider(AIProvider):
             }
 
             if system_content:
-                api_params["system"] = system_content
+                if request.cache_system_prompt:
+                    # Mark the static prefix as cacheable (prompt caching)
+                    api_params["system"] = [{
+                        "type": "text",
+                        "text": system_content,
+                        "cache_control": {"type": "ephemeral"}
+                    }]
+                else:
+                    api_params["system"] = system_content
 
             response = self.client.messages.create(**api_params)
 
@@ -91,7 +99,9 @@ class AnthropicProvider(AIProvider):
                 usage={
                     "input_tokens": input_tokens,
                     "output_tokens": output_tokens,
-                    "total_tokens": total_tokens
+                    "total_tokens": total_tokens,
+                    "cache_read_input_tokens": getattr(response.usage, "cache_read_input_tokens", None) or 0,
+                    "cache_creation_input_tokens": getattr(response.usage, "cache_creation_input_tokens", None) or 0
                 },
                 finish_reason=response.stop_reason
             )
@@ -356,6 +356,7 @@ def _show_plugin_management_menu(prompts: PromptsRenderer, text: TextRenderer, c
 
                     # After successful installation, automatically configure the plugin
                     spacer.line()
+                    PluginRegistry.refresh_cache()
                     config.registry.reset()
 
                     # Use the existing interactive configuration function
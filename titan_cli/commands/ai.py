@@ -329,7 +329,7 @@ def configure_ai_interactive():
         global_config_data["ai"]["default"] = provider_id
     elif "default" not in global_config_data["ai"]:
         # Si no hay default, usar el primero
-        global_config_data["ai"]["default"] = list(global_config_data["ai"]["providers"].keys())[0]
+        global_config_data["ai"]["default"] = next(iter(global_config_data["ai"]["providers"]))
 
 
     # Guardar en disco
@@ -34,7 +34,7 @@ def list_plugins():
                 plugin_config = config.config.plugins.get(plugin_name)
                 enabled = plugin_config.enabled if plugin_config else True
                 config_dict = plugin_config.config if plugin_config else {}
-                config_str = "\n".join([f"{k}: {v}" for k, v in config_dict.items()]) if config_dict else msg.Plugins.NO_CONFIG
+                config_str = "\n".join(f"{k}: {v}" for k, v in config_dict.items()) if config_dict else msg.Plugins.NO_CONFIG
                 rows.append([plugin_name, "✓" if enabled else "✗", config_str])
         table_renderer.print_table(headers=headers, rows=rows)
     else:
@@ -1,9 +1,22 @@
 # core/plugin_registry.py
-from importlib.metadata import entry_points
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from importlib.metadata import EntryPoint, entry_points
+from typing import Dict, List, Any, Optional, Tuple
 from ..errors import PluginLoadError, PluginInitializationError
 from .plugin_base import TitanPlugin
 
+
+@lru_cache(maxsize=None)
+def _cached_entry_points(group: str) -> Tuple[EntryPoint, ...]:
+    """
+    Entry points of a group, scanned once per process.
+
+    entry_points() reads the metadata of every installed distribution, and
+    registries are recreated on every config load.
+    """
+    return tuple(entry_points(group=group))
+
+
 class PluginRegistry:
     """Discovers and manages installed plugins."""
 
@@ -11,22 +24,33 @@ class PluginRegistry:
         self._plugins: Dict[str, TitanPlugin] = {}
         self._failed_plugins: Dict[str, Exception] = {}
         self._discovered_plugin_names: List[str] = []
+        self._unloaded: Dict[str, EntryPoint] = {}
         if discover_on_init:
             self.discover()
 
     def discover(self):
-        """Discover all installed Titan plugins."""
-        discovered = entry_points(group='titan.plugins')
+        """
+        Discover all installed Titan plugins.
+
+        Only the entry points are recorded here; plugin modules are imported
+        the first time the registry is queried (see _load_plugins).
+        """
+        discovered = _cached_entry_points('titan.plugins')
         self._discovered_plugin_names = [ep.name for ep in discovered]
-        for ep in discovered:
+        self._unloaded = {ep.name: ep for ep in discovered}
+
+    def _load_plugins(self) -> None:
+        """Load and instantiate the plugins discovered but not loaded yet."""
+        unloaded, self._unloaded = self._unloaded, {}
+        for name, ep in unloaded.items():
             try:
                 plugin_class = ep.load()
                 if not issubclass(plugin_class, TitanPlugin):
                     raise TypeError("Plugin class must inherit from TitanPlugin")
-                self._plugins[ep.name] = plugin_class()
+                self._plugins[name] = plugin_class()
             except Exception as e:
-                error = PluginLoadError(plugin_name=ep.name, original_exception=e)
-                self._failed_plugins[ep.name] = error
+                error = PluginLoadError(plugin_name=name, original_exception=e)
+                self._failed_plugins[name] = error
 
     def initialize_plugins(self, config: Any, secrets: Any) -> None:
         """
@@ -36,6 +60,8 @@ class PluginRegistry:
             config: TitanConfig instance
             secrets: SecretManager instance
         """
+        self._load_plugins()
+
         # Create a copy of plugin names to iterate over, as _plugins might change
         plugins_to_initialize = list(self._plugins.keys())
         initialized = set()
@@ -100,6 +126,7 @@ class PluginRegistry:
 
     def list_installed(self) -> List[str]:
         """List successfully loaded plugins."""
+        self._load_plugins()
         return list(self._plugins.keys())
 
     def list_discovered(self) -> List[str]:
@@ -113,12 +140,19 @@ class PluginRegistry:
         Returns:
             Dict mapping plugin name to error
         """
+        self._load_plugins()
         return self._failed_plugins.copy()
 
     def get_plugin(self, name: str) -> Optional[TitanPlugin]:
         """Get plugin instance by name."""
+        self._load_plugins()
         return self._plugins.get(name)
 
+    @staticmethod
+    def refresh_cache() -> None:
+        """Forget the cached entry points, e.g. after installing a plugin."""
+        _cached_entry_points.cache_clear()
+
     def reset(self):
         """Resets the registry, clearing all loaded plugins and re-discovering."""
         self._plugins.clear()
@@ -77,6 +77,12 @@ index 0000000..abc123
             "fix(git): handle uncommitted changes"
         ]
 
+    def get_branch_commits_and_diff(self, base: str, head: str) -> tuple[list[str], str]:
+        return self.get_branch_commits(base, head), self.get_branch_diff(base, head)
+
+    def rev_parse(self, *refs: str) -> list[str]:
+        return [f"{index:040x}" for index, _ in enumerate(refs, start=1)]
+
     def commit(self, message: str, all: bool = True) -> str:
         return "abc1234567890"
 
@@ -96,7 +102,7 @@ class MockAIClient:
     def is_available(self) -> bool:
         return True
 
-    def generate(self, messages, max_tokens: int = 1000, temperature: float = 0.7):
+    def generate(self, messages, max_tokens: int = 1000, temperature: float = 0.7, cache_system_prompt: bool = False):
         # Extract the prompt
         prompt = messages[0].content if messages else ""
 
@@ -6,7 +6,7 @@ from typing import Any, Optional, Union
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Success:
     """
     Step completed successfully.
@@ -22,7 +22,7 @@ class Success:
     message: str = ""
     metadata: Optional[dict[str, Any]] = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Error:
     """
     Step failed with an error.
@@ -44,7 +44,7 @@ class Error:
     recoverable: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Skip:
     """
     Step was skipped (not applicable).
@@ -121,7 +121,7 @@ def execute_ai_assistant_step(step: WorkflowStepModel, ctx: WorkflowContext) ->
         return Skip(msg.AIAssistant.NO_ASSISTANT_CLI_FOUND)
     
     if len(available_launchers) == 1:
-        cli_to_launch = list(available_launchers.keys())[0]
+        cli_to_launch = next(iter(available_launchers))
     else:
         menu = DynamicMenu(title=msg.AIAssistant.SELECT_ASSISTANT_CLI)
         cat = menu.add_category("Available CLIs")
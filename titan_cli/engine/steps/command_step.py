@@ -7,6 +7,8 @@ from titan_cli.engine.context import WorkflowContext
 from titan_cli.engine.results import Success, Error, WorkflowResult
 from titan_cli.engine.utils import get_poetry_venv_env
 
+_PLACEHOLDER_RE = re.compile(r'\$\{(\w+)\}')
+
 
 def resolve_parameters_in_string(text: str, ctx: WorkflowContext) -> str:
     """
@@ -19,7 +21,7 @@ def resolve_parameters_in_string(text: str, ctx: WorkflowContext) -> str:
             return str(ctx.data[placeholder])
         return match.group(0)
 
-    return re.sub(r'\$\{(\w+)\}', replace_placeholder, text)
+    return _PLACEHOLDER_RE.sub(replace_placeholder, text)
 
 
 def execute_command_step(step: WorkflowStepModel, ctx: WorkflowContext) -> WorkflowResult: